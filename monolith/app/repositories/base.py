@@ -24,7 +24,7 @@ from app.schemas.base import BaseDTO, MonetaID
 from sqlalchemy import desc, func, inspect, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy.orm import raiseload, sessionmaker, selectinload
 import logging
 
 logger = logging.getLogger()
@@ -45,6 +45,9 @@ class BasePGRepository(Generic[T]):
         # Map of relationship name -> list of nested relationships to eagerly load
         # Example: {"instruments": ["public_payload"]}
         nested_eager_relations: dict[str, list[str]] | None = None
+        # If True, any relationship not eagerly loaded raises on access
+        # instead of silently issuing a lazy-load query (N+1 guard)
+        raise_on_lazy_load: bool = False
 
     _instances: ClassVar[dict[sessionmaker, BasePGRepository]] = {}
 
@@ -203,6 +206,9 @@ class BasePGRepository(Generic[T]):
 
                         query = query.options(loader)
 
+                if getattr(self.Meta, "raise_on_lazy_load", False):
+                    query = query.options(raiseload("*"))
+
                 result = await session.execute(query)
                 loaded = result.scalars().unique().one()
 
@@ -328,6 +334,9 @@ class BasePGRepository(Generic[T]):
 
                             query = query.options(loader)
 
+                if getattr(self.Meta, "raise_on_lazy_load", False):
+                    query = query.options(raiseload("*"))
+
                 result = await session.execute(query)
                 # Use safe conversion when includes are specified to avoid
                 # lazy loading issues with unloaded relationships
@@ -400,6 +409,9 @@ class BasePGRepository(Generic[T]):
 
                 query = query.limit(1)
 
+                if getattr(self.Meta, "raise_on_lazy_load", False):
+                    query = query.options(raiseload("*"))
+
                 result = await session.execute(query)
 
                 for entity in result.scalars().unique():
@@ -463,6 +475,9 @@ class BasePGRepository(Generic[T]):
 
                             query = query.options(loader)
 
+                if getattr(self.Meta, "raise_on_lazy_load", False):
+                    query = query.options(raiseload("*"))
+
                 result = await session.execute(query)
                 entity = result.scalars().first()
                 if not entity:
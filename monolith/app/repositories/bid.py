@@ -20,7 +20,9 @@ class BidRepository(BasePGRepository[schemas.Bid]):
         response_model = schemas.Bid
         orm_model = models.Bid
         exclusion_fields = None
-        eager_relations = [models.Bid.listing]
+        # listing is loaded only when requested via includes
+        eager_relations = None
+        raise_on_lazy_load = True
 
     async def get_by_listing_id(
         self, listing_id: MonetaID
@@ -6,9 +6,11 @@ Each factory creates a single entity and returns it for use in tests.
 """
 
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, TypeVar
 from uuid import uuid4
 
+import bcrypt
 from app.enums import (
     AcquisitionReason,
     ActivationStatus,
@@ -33,10 +35,73 @@ from app.models.instrument_ownership import InstrumentOwnership
 from app.models.instrument_public_payload import InstrumentPublicPayload
 from app.models.listing import Listing
 from app.models.user import User
-from app.security import encrypt_password
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+ModelT = TypeVar("ModelT")
+
+# verify_password accepts any bcrypt work factor, so test users are hashed
+# with the minimum instead of the production default of 12
+_TEST_BCRYPT_ROUNDS = 4
+
+
+@lru_cache(maxsize=None)
+def hash_test_password(password: str) -> str:
+    """
+    Hash a password for a factory-created user.
+
+    Uses the minimum bcrypt work factor and caches the result per password,
+    so creating many users with the default password hashes it once. The
+    hash still verifies through the app's login flow.
+
+    Args:
+        password: Plain text password.
+
+    Returns:
+        The bcrypt hash as a string.
+    """
+    salt = bcrypt.gensalt(rounds=_TEST_BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def with_id_str(obj: ModelT) -> ModelT:
+    """
+    Attach the stringified primary key to a factory-created entity.
+
+    Tests pass ids around as strings (auth headers, URLs, JSON bodies and
+    response assertions); ``obj.id_str`` is computed once here instead of
+    calling ``str(obj.id)`` at every use.
+
+    Args:
+        obj: An ORM entity with an ``id`` attribute.
+
+    Returns:
+        The same entity, with ``id_str`` set.
+    """
+    obj.id_str = str(obj.id)
+    return obj
+
+
+def _company_row(
+    *,
+    legal_name: Optional[str] = None,
+    trade_name: Optional[str] = None,
+    registration_number: Optional[str] = None,
+    incorporation_date: Optional[date] = None,
+) -> Dict[str, Any]:
+    """Build the column values for one Company row."""
+    unique_suffix = uuid4().hex[:8]
+    return {
+        "id": uuid4(),
+        "legal_name": legal_name or f"Test Company {unique_suffix}",
+        "trade_name": trade_name,
+        "registration_number": registration_number or f"REG-{unique_suffix}",
+        "incorporation_date": incorporation_date or date(2020, 1, 1),
+        "created_at": datetime.utcnow(),
+    }
+
+
 class CompanyFactory:
     """Factory for creating Company entities in the test database."""
 
@@ -62,15 +127,11 @@ class CompanyFactory:
         Returns:
             The created Company ORM model.
         """
-        unique_suffix = uuid4().hex[:8]
-
-        company = Company(
-            id=uuid4(),
-            legal_name=legal_name or f"Test Company {unique_suffix}",
+        company = CompanyFactory.build(
+            legal_name=legal_name,
             trade_name=trade_name,
-            registration_number=registration_number or f"REG-{unique_suffix}",
-            incorporation_date=incorporation_date or date(2020, 1, 1),
-            created_at=datetime.utcnow(),
+            registration_number=registration_number,
+            incorporation_date=incorporation_date,
         )
 
         session.add(company)
@@ -78,6 +139,86 @@ class CompanyFactory:
         await session.refresh(company)
         return company
 
+    @staticmethod
+    def build(
+        *,
+        legal_name: Optional[str] = None,
+        trade_name: Optional[str] = None,
+        registration_number: Optional[str] = None,
+        incorporation_date: Optional[date] = None,
+    ) -> Company:
+        """
+        Build a Company without touching the database.
+
+        The caller adds it to a session (usually via ``add_all`` together
+        with related rows) and flushes once.
+
+        Args:
+            legal_name: Company legal name (auto-generated if not provided).
+            trade_name: Company trade name (optional).
+            registration_number: Company registration number (auto-generated if not provided).
+            incorporation_date: Date of incorporation (defaults to 2020-01-01).
+
+        Returns:
+            The unsaved Company ORM model.
+        """
+        return with_id_str(
+            Company(
+                **_company_row(
+                    legal_name=legal_name,
+                    trade_name=trade_name,
+                    registration_number=registration_number,
+                    incorporation_date=incorporation_date,
+                )
+            )
+        )
+
+    @staticmethod
+    async def create_many(
+        session: AsyncSession, specs: List[Dict[str, Any]]
+    ) -> List[Company]:
+        """
+        Create several Companies with a single ``INSERT ... RETURNING``.
+
+        Args:
+            session: The async database session.
+            specs: One company is created per dict, in order. Each holds
+                   the (all optional) keyword arguments of ``create``.
+
+        Returns:
+            The created Company ORM models.
+        """
+        companies = await session.scalars(
+            insert(Company).returning(Company, sort_by_parameter_order=True),
+            [_company_row(**spec) for spec in specs],
+        )
+        return [with_id_str(company) for company in companies.all()]
+
+
+def _user_row(
+    company: Company,
+    *,
+    email: Optional[str] = None,
+    password: str = "TestPassword123!",
+    first_name: str = "Test",
+    last_name: str = "User",
+    role: UserRole = UserRole.BUYER,
+    account_status: ActivationStatus = ActivationStatus.ACTIVE,
+) -> Dict[str, Any]:
+    """Build the column values for one User row."""
+    unique_suffix = uuid4().hex[:8]
+    return {
+        "id": uuid4(),
+        "email": email or f"test.user.{unique_suffix}@example.com",
+        "password": hash_test_password(password),
+        "first_name": first_name,
+        "last_name": last_name,
+        "company_id": company.id,
+        "role": role,
+        "account_status": account_status,
+        "created_at": datetime.utcnow(),
+    }
+
 
 class UserFactory:
     """Factory for creating User entities in the test database."""
@@ -110,18 +251,14 @@ class UserFactory:
         Returns:
             The created User ORM model.
         """
-        unique_suffix = uuid4().hex[:8]
-
-        user = User(
-            id=uuid4(),
-            email=email or f"test.user.{unique_suffix}@example.com",
-            password=encrypt_password(password),
+        user = UserFactory.build(
+            company,
+            email=email,
+            password=password,
             first_name=first_name,
             last_name=last_name,
-            company_id=company.id,
             role=role,
             account_status=account_status,
-            created_at=datetime.utcnow(),
         )
 
         session.add(user)
@@ -129,6 +266,49 @@ class UserFactory:
         await session.refresh(user)
         return user
 
+    @staticmethod
+    def build(
+        company: Company,
+        *,
+        email: Optional[str] = None,
+        password: str = "TestPassword123!",
+        first_name: str = "Test",
+        last_name: str = "User",
+        role: UserRole = UserRole.BUYER,
+        account_status: ActivationStatus = ActivationStatus.ACTIVE,
+    ) -> User:
+        """
+        Build a User without touching the database.
+
+        The caller adds it to a session (usually via ``add_all`` together
+        with its Company) and flushes once.
+
+        Args:
+            company: The Company the user belongs to.
+            email: User email (auto-generated if not provided).
+            password: Plain text password (will be encrypted).
+            first_name: User first name.
+            last_name: User last name.
+            role: User role (defaults to BUYER).
+            account_status: Account status (defaults to ACTIVE).
+
+        Returns:
+            The unsaved User ORM model.
+        """
+        return with_id_str(
+            User(
+                **_user_row(
+                    company,
+                    email=email,
+                    password=password,
+                    first_name=first_name,
+                    last_name=last_name,
+                    role=role,
+                    account_status=account_status,
+                )
+            )
+        )
+
     @staticmethod
     async def create_admin(
         session: AsyncSession,
@@ -296,7 +476,7 @@ class InstrumentFactory:
         await session.flush()
 
         await session.refresh(instrument)
-        return instrument
+        return with_id_str(instrument)
 
     @staticmethod
     async def create_pending_approval(
@@ -388,18 +568,14 @@ class CompanyAddressFactory:
         Returns:
             The created CompanyAddress ORM model.
         """
-        unique_suffix = uuid4().hex[:8]
-
-        address = CompanyAddress(
-            id=uuid4(),
-            company_id=company.id,
-            type=address_type,
-            street=street or f"123 Test Street {unique_suffix}",
+        address = CompanyAddressFactory.build(
+            company,
+            address_type=address_type,
+            street=street,
             city=city,
             state=state,
             postal_code=postal_code,
             country=country,
-            created_at=datetime.utcnow(),
         )
 
         session.add(address)
@@ -407,6 +583,50 @@ class CompanyAddressFactory:
         await session.refresh(address)
         return address
 
+    @staticmethod
+    def build(
+        company: Company,
+        *,
+        address_type: AddressType = AddressType.REGISTERED,
+        street: Optional[str] = None,
+        city: str = "New York",
+        state: Optional[str] = "NY",
+        postal_code: str = "10001",
+        country: str = "US",
+    ) -> CompanyAddress:
+        """
+        Build a CompanyAddress without touching the database.
+
+        The caller adds it to a session (usually via ``add_all`` together
+        with its Company) and flushes once.
+
+        Args:
+            company: The Company this address belongs to.
+            address_type: Type of address (defaults to REGISTERED).
+            street: Street address (auto-generated if not provided).
+            city: City name.
+            state: State/province (optional).
+            postal_code: Postal/ZIP code.
+            country: ISO 3166-1 alpha-2 country code.
+
+        Returns:
+            The unsaved CompanyAddress ORM model.
+        """
+        unique_suffix = uuid4().hex[:8]
+        return with_id_str(
+            CompanyAddress(
+                id=uuid4(),
+                company_id=company.id,
+                type=address_type,
+                street=street or f"123 Test Street {unique_suffix}",
+                city=city,
+                state=state,
+                postal_code=postal_code,
+                country=country,
+                created_at=datetime.utcnow(),
+            )
+        )
+
     @staticmethod
     async def create_billing(
         session: AsyncSession,
@@ -502,7 +722,7 @@ class DocumentFactory:
         session.add(document)
         await session.flush()
         await session.refresh(document)
-        return document
+        return with_id_str(document)
 
 
 class InstrumentDocumentFactory:
@@ -535,7 +755,7 @@ class InstrumentDocumentFactory:
         session.add(instrument_document)
         await session.flush()
         await session.refresh(instrument_document)
-        return instrument_document
+        return with_id_str(instrument_document)
 
 
 class InstrumentOwnershipFactory:
@@ -578,7 +798,7 @@ class InstrumentOwnershipFactory:
         session.add(ownership)
         await session.flush()
         await session.refresh(ownership)
-        return ownership
+        return with_id_str(ownership)
 
     @staticmethod
     async def create_active(
@@ -634,13 +854,8 @@ class ListingFactory:
         Returns:
             The created Listing ORM model.
         """
-        listing = Listing(
-            id=uuid4(),
-            instrument_id=instrument.id,
-            seller_company_id=seller_company.id,
-            listing_creator_user_id=creator_user.id,
-            status=status,
-            created_at=datetime.utcnow(),
+        listing = ListingFactory.build(
+            instrument, seller_company, creator_user, status=status
         )
 
         session.add(listing)
@@ -648,6 +863,40 @@ class ListingFactory:
         await session.refresh(listing)
         return listing
 
+    @staticmethod
+    def build(
+        instrument: Instrument,
+        seller_company: Company,
+        creator_user: User,
+        *,
+        status: ListingStatus = ListingStatus.OPEN,
+    ) -> Listing:
+        """
+        Build a Listing without touching the database.
+
+        The caller adds it to a session (usually via ``add_all`` together
+        with related rows) and flushes once.
+
+        Args:
+            instrument: The Instrument being listed.
+            seller_company: The Company selling the instrument.
+            creator_user: The User who created the listing.
+            status: Listing status (defaults to OPEN).
+
+        Returns:
+            The unsaved Listing ORM model.
+        """
+        return with_id_str(
+            Listing(
+                id=uuid4(),
+                instrument_id=instrument.id,
+                seller_company_id=seller_company.id,
+                listing_creator_user_id=creator_user.id,
+                status=status,
+                created_at=datetime.utcnow(),
+            )
+        )
+
     @staticmethod
     async def create_open(
         session: AsyncSession,
@@ -757,6 +1006,196 @@ class ListingFactory:
         )
 
 
+class ListingGraphFactory:
+    """Factory for creating a complete seller-side listing graph."""
+
+    @staticmethod
+    async def create_open_listing_graph(
+        session: AsyncSession,
+        *,
+        legal_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create company, issuer, active instrument, ownership and OPEN listing.
+
+        All UUIDs are generated client-side, so the rows do not depend on
+        each other's refreshed state and are written with ``add_all`` in a
+        single flush, instead of the flush + refresh round-trips of chaining
+        the individual factories.
+
+        Args:
+            session: The async database session.
+            legal_name: Seller company legal name (auto-generated if not provided).
+
+        Returns:
+            Dict with ``seller_company``, ``seller_user``, ``instrument``,
+            ``ownership`` and ``listing_open`` ORM models.
+        """
+        unique_suffix = uuid4().hex[:8]
+        now = datetime.utcnow()
+
+        company = Company(
+            id=uuid4(),
+            legal_name=legal_name or f"Test Company {unique_suffix}",
+            registration_number=f"REG-{unique_suffix}",
+            incorporation_date=date(2020, 1, 1),
+            created_at=now,
+        )
+        user = User(
+            id=uuid4(),
+            email=f"test.user.{unique_suffix}@example.com",
+            password=hash_test_password("IssuerPassword123!"),
+            first_name="Issuer",
+            last_name="User",
+            company_id=company.id,
+            role=UserRole.ISSUER,
+            account_status=ActivationStatus.ACTIVE,
+            created_at=now,
+        )
+        instrument = Instrument(
+            id=uuid4(),
+            name=f"Test Instrument {unique_suffix}",
+            face_value=10000.00,
+            currency="USD",
+            maturity_date=date.today() + timedelta(days=90),
+            maturity_payment=10500.00,
+            instrument_status=InstrumentStatus.ACTIVE,
+            maturity_status=MaturityStatus.DUE,
+            trading_status=TradingStatus.LISTED,
+            issuer_id=company.id,
+            created_by=user.id,
+            created_at=now,
+        )
+        payload_record = InstrumentPublicPayload(
+            id=uuid4(),
+            instrument_id=instrument.id,
+            payload={},
+            created_at=now,
+        )
+        ownership = InstrumentOwnership(
+            id=uuid4(),
+            instrument_id=instrument.id,
+            owner_id=company.id,
+            acquired_at=now,
+            relinquished_at=None,
+            acquisition_reason=AcquisitionReason.ISSUANCE,
+            created_at=now,
+        )
+        listing = Listing(
+            id=uuid4(),
+            instrument_id=instrument.id,
+            seller_company_id=company.id,
+            listing_creator_user_id=user.id,
+            status=ListingStatus.OPEN,
+            created_at=now,
+        )
+
+        session.add_all(
+            [company, user, instrument, payload_record, ownership, listing]
+        )
+        await session.flush()
+        for obj in (company, user, instrument, ownership, listing):
+            with_id_str(obj)
+        return {
+            "seller_company": company,
+            "seller_user": user,
+            "instrument": instrument,
+            "ownership": ownership,
+            "listing_open": listing,
+        }
+
+
+class BidScenarioFactory:
+    """Factory for the parties shared by the bid lifecycle tests."""
+
+    @staticmethod
+    async def create_parties(
+        session: AsyncSession, seller_company: Company
+    ) -> Dict[str, Any]:
+        """
+        Create two bidder companies with an issuer each, plus a seller admin.
+
+        Companies and users are each inserted with one multi-row
+        ``INSERT ... RETURNING``, so the whole set costs two round trips
+        instead of one flush per entity.
+
+        Args:
+            session: The async database session.
+            seller_company: The company the admin user belongs to.
+
+        Returns:
+            Dict with ``bidder_company``, ``bidder_user``, ``other_company``,
+            ``other_user`` and ``admin`` ORM objects.
+        """
+        bidder_company, other_company = (
+            await session.scalars(
+                insert(Company).returning(Company, sort_by_parameter_order=True),
+                [
+                    _company_row(legal_name="Bidder Co"),
+                    _company_row(legal_name="Other Bidder Co"),
+                ],
+            )
+        ).all()
+        issuer = {
+            "password": "IssuerPassword123!",
+            "first_name": "Issuer",
+            "role": UserRole.ISSUER,
+        }
+        bidder_user, other_user, admin = (
+            await session.scalars(
+                insert(User).returning(User, sort_by_parameter_order=True),
+                [
+                    _user_row(bidder_company, **issuer),
+                    _user_row(other_company, **issuer),
+                    _user_row(
+                        seller_company,
+                        password="AdminPassword123!",
+                        first_name="Admin",
+                        role=UserRole.ADMIN,
+                    ),
+                ],
+            )
+        ).all()
+
+        return {
+            "bidder_company": with_id_str(bidder_company),
+            "bidder_user": with_id_str(bidder_user),
+            "other_company": with_id_str(other_company),
+            "other_user": with_id_str(other_user),
+            "admin": with_id_str(admin),
+        }
+
+
+# Built once and reused for every bid insert. Bids are the most frequently
+# created rows, so they skip the unit of work (add/flush/refresh) and go
+# through a plain bulk INSERT with client-generated ids instead.
+_BID_INSERT = insert(Bid)
+
+
+def _bid_row(
+    listing: Listing,
+    bidder_company: Company,
+    bidder_user: User,
+    *,
+    amount: float,
+    currency: str,
+    status: BidStatus,
+    valid_until: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Build the column values for one Bid row."""
+    return {
+        "id": uuid4(),
+        "listing_id": listing.id,
+        "bidder_company_id": bidder_company.id,
+        "bidder_user_id": bidder_user.id,
+        "amount": amount,
+        "currency": currency,
+        "valid_until": valid_until,
+        "status": status,
+        "created_at": datetime.utcnow(),
+    }
+
+
 class BidFactory:
     """Factory for creating Bid entities in the test database."""
 
@@ -786,24 +1225,57 @@ class BidFactory:
             status: Bid status (defaults to PENDING).
 
         Returns:
-            The created Bid ORM model.
+            The created Bid ORM model (not attached to the session).
         """
-        bid = Bid(
-            id=uuid4(),
-            listing_id=listing.id,
-            bidder_company_id=bidder_company.id,
-            bidder_user_id=bidder_user.id,
+        row = _bid_row(
+            listing,
+            bidder_company,
+            bidder_user,
             amount=amount,
             currency=currency,
             valid_until=valid_until,
             status=status,
-            created_at=datetime.utcnow(),
         )
 
-        session.add(bid)
-        await session.flush()
-        await session.refresh(bid)
-        return bid
+        await session.execute(_BID_INSERT, [row])
+        return with_id_str(Bid(**row))
+
+    @staticmethod
+    def build(
+        listing: Listing,
+        bidder_company: Company,
+        bidder_user: User,
+        *,
+        amount: float = 10000.00,
+        currency: str = "USD",
+        valid_until: Optional[datetime] = None,
+        status: BidStatus = BidStatus.PENDING,
+    ) -> Bid:
+        """
+        Build a Bid without touching the database.
+
+        Args:
+            listing: The Listing being bid on.
+            bidder_company: The Company making the bid.
+            bidder_user: The User who created the bid.
+            amount: Bid amount (defaults to 10000.00).
+            currency: ISO 4217 currency code (defaults to USD).
+            valid_until: Optional bid expiration timestamp.
+            status: Bid status (defaults to PENDING).
+
+        Returns:
+            The unsaved Bid ORM model.
+        """
+        row = _bid_row(
+            listing,
+            bidder_company,
+            bidder_user,
+            amount=amount,
+            currency=currency,
+            valid_until=valid_until,
+            status=status,
+        )
+        return with_id_str(Bid(**row))
 
     @staticmethod
     async def create_pending(
@@ -907,6 +1379,49 @@ class BidFactory:
             status=BidStatus.SELECTED,
         )
 
+    @staticmethod
+    async def create_pending_many(
+        session: AsyncSession,
+        listing: Listing,
+        bidder_company: Company,
+        bidder_user: User,
+        amounts: List[float],
+        *,
+        currency: str = "USD",
+    ) -> List[Bid]:
+        """
+        Create several PENDING Bids with a single INSERT.
+
+        All rows are passed to one execute of the cached bid INSERT, which
+        SQLAlchemy sends as a single multi-row statement instead of one
+        INSERT per ``create_pending`` call.
+
+        Args:
+            session: The async database session.
+            listing: The Listing being bid on.
+            bidder_company: The Company making the bids.
+            bidder_user: The User who created the bids.
+            amounts: One bid is created per amount, in order.
+            currency: ISO 4217 currency code.
+
+        Returns:
+            The created PENDING Bid ORM models (not attached to the session).
+        """
+        rows = [
+            _bid_row(
+                listing,
+                bidder_company,
+                bidder_user,
+                amount=amount,
+                currency=currency,
+                status=BidStatus.PENDING,
+            )
+            for amount in amounts
+        ]
+
+        await session.execute(_BID_INSERT, rows)
+        return [with_id_str(Bid(**row)) for row in rows]
+
 
 class AskFactory:
     """Factory for creating Ask entities in the test database."""
@@ -960,7 +1475,7 @@ class AskFactory:
         session.add(ask)
         await session.flush()
         await session.refresh(ask)
-        return ask
+        return with_id_str(ask)
 
     @staticmethod
     async def create_active(
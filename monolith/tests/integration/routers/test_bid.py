@@ -10,296 +10,106 @@ Tests bid CRUD operations with various scenarios:
 - Reject bid
 """
 
+import asyncio
+
 import pytest
 from app.enums import BidStatus, ListingStatus, UserRole
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from tests.factories import (
-    BidFactory,
-    CompanyFactory,
-    InstrumentFactory,
-    InstrumentOwnershipFactory,
-    ListingFactory,
-    UserFactory,
-)
-
-
-class TestSearchBids:
-    """Tests for POST /v1/bid/search endpoint."""
-
-    @pytest.mark.asyncio
-    async def test_search_bids_success(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test search bids returns list of bids.
-
-        Arrange: Create listings and bids.
-        Act: POST /v1/bid/search with valid auth.
-        Assert: Response is 200 with list of bids.
-        """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session, legal_name="Seller Co")
-        bidder_company = await CompanyFactory.create(db_session, legal_name="Bidder Co")
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user, amount=10000.00
-        )
-        await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user, amount=15000.00
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(seller_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            "/v1/bid/search",
-            headers=headers,
-            json={},
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) >= 2
 
-    @pytest.mark.asyncio
-    async def test_search_bids_with_status_filter(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test search bids by status filter.
+# Well-formed id that never matches a seeded row
+FAKE_UUID = "00000000-0000-0000-0000-000000000000"
 
-        Arrange: Create bids with different statuses.
-        Act: POST /v1/bid/search with status filter.
-        Assert: Response contains only bids with matching status.
-        """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        await BidFactory.create_pending(db_session, listing, bidder_company, bidder_user)
-        await BidFactory.create_withdrawn(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(seller_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            "/v1/bid/search",
-            headers=headers,
-            json={"status": "PENDING"},
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        statuses = [bid["status"] for bid in data]
-        assert all(s == "PENDING" for s in statuses)
-
-    @pytest.mark.asyncio
-    async def test_search_bids_with_listing_filter(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test search bids by listing ID filter.
-
-        Arrange: Create bids on different listings.
-        Act: POST /v1/bid/search with listingId filter.
-        Assert: Response contains only bids for matching listing.
-        """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument1 = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        instrument2 = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument1, seller_company
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument2, seller_company
-        )
-        listing1 = await ListingFactory.create_open(
-            db_session, instrument1, seller_company, seller_user
-        )
-        listing2 = await ListingFactory.create_open(
-            db_session, instrument2, seller_company, seller_user
-        )
-        await BidFactory.create_pending(
-            db_session, listing1, bidder_company, bidder_user
-        )
-        await BidFactory.create_pending(
-            db_session, listing2, bidder_company, bidder_user
-        )
-        await db_session.commit()
+def _has_nested_listing1(data: list, graph: dict) -> bool:
+    """Check that a bid on listing1 is returned with its listing nested."""
+    listing_id = graph["listing1"].id_str
+    by_listing = {b["listingId"]: b for b in data}
+    bid = by_listing.get(listing_id)
+    return (
+        bid is not None
+        and bid["listing"] is not None
+        and bid["listing"]["id"] == listing_id
+    )
 
-        headers = auth_headers(
-            user_id=str(seller_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
-        )
 
-        # Act
-        response = await test_client.post(
-            "/v1/bid/search",
-            headers=headers,
-            json={"listingId": [str(listing1.id)]},
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        listing_ids = [bid["listingId"] for bid in data]
-        assert all(lid == str(listing1.id) for lid in listing_ids)
+class TestSearchBids:
+    """Tests for POST /v1/bid/search endpoint."""
 
     @pytest.mark.asyncio
-    async def test_search_bids_with_listing_include(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+    @pytest.mark.parametrize(
+        "params, payload, check",
+        [
+            pytest.param(
+                None,
+                lambda graph: {},
+                lambda data, graph: len(data) >= 2,
+                id="all",
+            ),
+            pytest.param(
+                None,
+                lambda graph: {"status": "PENDING"},
+                lambda data, graph: all(b["status"] == "PENDING" for b in data),
+                id="status_filter",
+            ),
+            pytest.param(
+                None,
+                lambda graph: {"listingId": [graph["listing1"].id_str]},
+                lambda data, graph: {b["listingId"] for b in data}
+                == {graph["listing1"].id_str},
+                id="listing_filter",
+            ),
+            pytest.param(
+                {"include": "listing"},
+                lambda graph: {},
+                _has_nested_listing1,
+                id="listing_include",
+            ),
+            pytest.param(
+                None,
+                lambda graph: {"limit": 2, "offset": 0},
+                lambda data, graph: len(data) == 2,
+                id="pagination",
+            ),
+        ],
+    )
+    async def test_search_bids_success(
+        self,
+        search_as_seller,
+        bids_graph,
+        count_queries,
+        params,
+        payload,
+        check,
     ):
         """
-        Test search bids with listing include.
+        Test search bids with filters, includes and pagination.
 
-        Arrange: Create bid on a listing.
-        Act: POST /v1/bid/search with ?include=listing.
-        Assert: Response contains bids with nested listing.
+        Arrange: Use the module-scoped search graph (two listings with
+                 PENDING and WITHDRAWN bids).
+        Act: POST /v1/bid/search as the seeded seller with each case's
+             query params and body.
+        Assert: Response is 200 and the case's check holds on the data.
         """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        await BidFactory.create_pending(db_session, listing, bidder_company, bidder_user)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(seller_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
-        )
-
         # Act
-        response = await test_client.post(
-            "/v1/bid/search?include=listing",
-            headers=headers,
-            json={},
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) >= 1
-        bid_with_listing = next(
-            (b for b in data if b["listingId"] == str(listing.id)), None
-        )
-        assert bid_with_listing is not None
-        assert bid_with_listing["listing"] is not None
-        assert bid_with_listing["listing"]["id"] == str(listing.id)
-
-    @pytest.mark.asyncio
-    async def test_search_bids_pagination(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test search bids with pagination.
-
-        Arrange: Create multiple bids.
-        Act: POST /v1/bid/search with limit and offset.
-        Assert: Response contains paginated results.
-        """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        for i in range(5):
-            await BidFactory.create_pending(
-                db_session, listing, bidder_company, bidder_user, amount=10000.0 + i * 1000
+        with count_queries() as queries:
+            response = await search_as_seller(
+                params=params, json=payload(bids_graph)
             )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(seller_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
-        )
-
-        # Act - Get first 2 bids
-        response = await test_client.post(
-            "/v1/bid/search",
-            headers=headers,
-            json={"limit": 2, "offset": 0},
-        )
 
         # Assert
         assert response.status_code == 200
+        assert len(queries) <= 2
         data = response.json()
-        assert len(data) == 2
+        assert isinstance(data, list)
+        assert check(data, bids_graph)
 
     @pytest.mark.asyncio
     @pytest.mark.skip(
         reason="All roles have VIEW.INSTRUMENT permission; no role exists to test 403"
     )
+    @pytest.mark.negative
     async def test_search_bids_without_permission_returns_403(
         self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
     ):
@@ -311,14 +121,16 @@ class TestSearchBids:
         Assert: Response is 403 Forbidden.
         """
         # Arrange
+        from tests.factories import CompanyFactory, UserFactory
+
         company = await CompanyFactory.create(db_session)
         buyer = await UserFactory.create(db_session, company, role=UserRole.BUYER)
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(buyer.id),
+            user_id=buyer.id_str,
             role=UserRole.BUYER,
-            company_id=str(company.id),
+            company_id=company.id_str,
         )
 
         # Act
@@ -337,119 +149,86 @@ class TestGetBidById:
 
     @pytest.mark.asyncio
     async def test_get_bid_by_id_success(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        auth_headers,
+        seller_seed,
+        bids_graph,
+        count_queries,
     ):
         """
         Test get bid by ID returns bid data.
 
-        Arrange: Create bid.
+        Arrange: Use the shared PENDING bid on listing1.
         Act: GET /v1/bid/{bid_id} with valid auth.
         Assert: Response is 200 with bid data.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user, amount=12500.00
-        )
-        await db_session.commit()
-
+        bid = bids_graph["pending_bid"]
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_seed["seller_user"].id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_seed["seller_company"].id_str,
         )
 
         # Act
-        response = await test_client.get(f"/v1/bid/{bid.id}", headers=headers)
+        with count_queries() as queries:
+            response = await test_client.get(f"/v1/bid/{bid.id}", headers=headers)
 
         # Assert
         assert response.status_code == 200
+        assert len(queries) <= 2
         data = response.json()
-        assert data["id"] == str(bid.id)
-        assert data["listingId"] == str(listing.id)
-        assert data["bidderCompanyId"] == str(bidder_company.id)
-        assert data["bidderUserId"] == str(bidder_user.id)
-        assert data["amount"] == 12500.00
+        assert data["id"] == bid.id_str
+        assert data["listingId"] == bids_graph["listing1"].id_str
+        assert data["bidderCompanyId"] == bids_graph["bidder_company"].id_str
+        assert data["bidderUserId"] == bids_graph["bidder_user"].id_str
+        assert data["amount"] == 10000.00
         assert data["currency"] == "USD"
         assert data["status"] == "PENDING"
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_get_bid_by_nonexistent_id_returns_404(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, seller_headers
     ):
         """
         Test get bid by non-existent ID returns 404.
 
-        Arrange: Create company and user for auth.
-        Act: GET /v1/bid/{fake_uuid} with valid auth.
+        Arrange: Use the seeded seller's headers; identity does not matter.
+        Act: GET /v1/bid/{FAKE_UUID} with valid auth.
         Assert: Response is 404 Not Found.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        issuer = await UserFactory.create_issuer(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(issuer.id),
-            role=UserRole.ISSUER,
-            company_id=str(company.id),
-        )
-        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        headers = seller_headers
 
         # Act
-        response = await test_client.get(f"/v1/bid/{fake_uuid}", headers=headers)
+        response = await test_client.get(f"/v1/bid/{FAKE_UUID}", headers=headers)
 
         # Assert
         assert response.status_code == 404
 
     @pytest.mark.asyncio
     async def test_get_bid_with_include_listing(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        auth_headers,
+        seller_seed,
+        bids_graph,
     ):
         """
         Test get bid with include=listing returns nested listing.
 
-        Arrange: Create bid on a listing.
+        Arrange: Use the shared PENDING bid on listing1.
         Act: GET /v1/bid/{bid_id}?include=listing.
         Assert: Response contains bid with nested listing data.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
-
+        bid = bids_graph["pending_bid"]
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_seed["seller_user"].id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_seed["seller_company"].id_str,
         )
 
         # Act
@@ -461,43 +240,29 @@ class TestGetBidById:
         assert response.status_code == 200
         data = response.json()
         assert data["listing"] is not None
-        assert data["listing"]["id"] == str(listing.id)
+        assert data["listing"]["id"] == bids_graph["listing1"].id_str
 
     @pytest.mark.asyncio
     async def test_get_bid_without_include_returns_null_listing(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        auth_headers,
+        seller_seed,
+        bids_graph,
     ):
         """
         Test get bid without include returns null listing.
 
-        Arrange: Create bid.
+        Arrange: Use the shared PENDING bid on listing1.
         Act: GET /v1/bid/{bid_id} without include.
         Assert: Response contains bid with listing as null.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
-
+        bid = bids_graph["pending_bid"]
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_seed["seller_user"].id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_seed["seller_company"].id_str,
         )
 
         # Act
@@ -514,36 +279,29 @@ class TestCreateBid:
 
     @pytest.mark.asyncio
     async def test_create_bid_success(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test create bid with valid data returns created bid.
 
-        Arrange: Create seller company with listing, bidder company with user.
+        Arrange: Use the scenario's OPEN listing and bidder issuer.
         Act: POST /v1/bid with listing_id and amount.
         Assert: Response is 200 with created bid.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session, legal_name="Seller Co")
-        bidder_company = await CompanyFactory.create(db_session, legal_name="Bidder Co")
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        bidder_company = bid_scenario["bidder_company"]
+        bidder_user = bid_scenario["bidder_user"]
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        await db_session.commit()
+        listing = bid_scenario["listing"]
 
         headers = auth_headers(
-            user_id=str(bidder_user.id),
+            user_id=bidder_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(bidder_company.id),
+            company_id=bidder_company.id_str,
         )
 
         # Act
@@ -551,7 +309,7 @@ class TestCreateBid:
             "/v1/bid/",
             headers=headers,
             json={
-                "listingId": str(listing.id),
+                "listingId": listing.id_str,
                 "amount": 20000.00,
                 "currency": "USD",
             },
@@ -560,9 +318,9 @@ class TestCreateBid:
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["listingId"] == str(listing.id)
-        assert data["bidderCompanyId"] == str(bidder_company.id)
-        assert data["bidderUserId"] == str(bidder_user.id)
+        assert data["listingId"] == listing.id_str
+        assert data["bidderCompanyId"] == bidder_company.id_str
+        assert data["bidderUserId"] == bidder_user.id_str
         assert data["amount"] == 20000.00
         assert data["currency"] == "USD"
         assert data["status"] == "PENDING"
@@ -570,36 +328,29 @@ class TestCreateBid:
 
     @pytest.mark.asyncio
     async def test_create_bid_with_valid_until(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test create bid with validUntil timestamp.
 
-        Arrange: Create listing and bidder user.
+        Arrange: Use the scenario's OPEN listing and bidder issuer.
         Act: POST /v1/bid with validUntil.
         Assert: Response is 200 with validUntil set.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        bidder_company = bid_scenario["bidder_company"]
+        bidder_user = bid_scenario["bidder_user"]
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        await db_session.commit()
+        listing = bid_scenario["listing"]
 
         headers = auth_headers(
-            user_id=str(bidder_user.id),
+            user_id=bidder_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(bidder_company.id),
+            company_id=bidder_company.id_str,
         )
 
         # Act
@@ -607,7 +358,7 @@ class TestCreateBid:
             "/v1/bid/",
             headers=headers,
             json={
-                "listingId": str(listing.id),
+                "listingId": listing.id_str,
                 "amount": 25000.00,
                 "currency": "EUR",
                 "validUntil": "2025-12-31T23:59:59Z",
@@ -620,34 +371,26 @@ class TestCreateBid:
         assert data["validUntil"] is not None
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_create_bid_nonexistent_listing_returns_404(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, seller_headers
     ):
         """
         Test create bid with non-existent listing returns 404.
 
-        Arrange: Create company and user.
+        Arrange: Use the seeded seller's headers; identity does not matter.
         Act: POST /v1/bid with fake listing_id.
         Assert: Response is 404 Not Found.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        user = await UserFactory.create_issuer(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(user.id),
-            role=UserRole.ISSUER,
-            company_id=str(company.id),
-        )
-        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        headers = seller_headers
 
         # Act
         response = await test_client.post(
             "/v1/bid/",
             headers=headers,
             json={
-                "listingId": fake_uuid,
+                "listingId": FAKE_UUID,
                 "amount": 10000.00,
                 "currency": "USD",
             },
@@ -659,37 +402,39 @@ class TestCreateBid:
         assert "Listing" in data["detail"]
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_create_bid_on_non_open_listing_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test create bid on non-OPEN listing returns 403.
 
-        Arrange: Create WITHDRAWN listing and bidder user.
+        Arrange: Create WITHDRAWN listing; use the scenario's bidder issuer.
         Act: POST /v1/bid.
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        from tests.factories import ListingFactory
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
+        seller_company = bid_scenario["seller_company"]
+        bidder_company = bid_scenario["bidder_company"]
+        seller_user = bid_scenario["seller_user"]
+        bidder_user = bid_scenario["bidder_user"]
+
+        instrument = bid_scenario["instrument"]
         listing = await ListingFactory.create_withdrawn(
             db_session, instrument, seller_company, seller_user
         )
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(bidder_user.id),
+            user_id=bidder_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(bidder_company.id),
+            company_id=bidder_company.id_str,
         )
 
         # Act
@@ -697,7 +442,7 @@ class TestCreateBid:
             "/v1/bid/",
             headers=headers,
             json={
-                "listingId": str(listing.id),
+                "listingId": listing.id_str,
                 "amount": 10000.00,
                 "currency": "USD",
             },
@@ -709,43 +454,27 @@ class TestCreateBid:
         assert "not open" in data["detail"].lower()
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_create_bid_on_own_listing_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, seller_seed, seller_headers
     ):
         """
         Test create bid on own listing returns 403 (no self-bidding).
 
-        Arrange: Create listing and try to bid as seller.
+        Arrange: Use the seeded seller's open listing and headers.
         Act: POST /v1/bid with same company as seller.
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(seller_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
-        )
+        listing = seller_seed["listing_open"]
+        headers = seller_headers
 
         # Act
         response = await test_client.post(
             "/v1/bid/",
             headers=headers,
             json={
-                "listingId": str(listing.id),
+                "listingId": listing.id_str,
                 "amount": 10000.00,
                 "currency": "USD",
             },
@@ -758,58 +487,51 @@ class TestCreateBid:
 
     @pytest.mark.asyncio
     async def test_create_multiple_bids_same_company_succeeds(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test one company can make multiple bids on the same listing.
 
-        Arrange: Create listing and bidder company.
+        Arrange: Use the scenario's OPEN listing and bidder issuer.
         Act: POST /v1/bid twice with same company.
         Assert: Both responses are 200 with different bids.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        bidder_company = bid_scenario["bidder_company"]
+        bidder_user = bid_scenario["bidder_user"]
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        await db_session.commit()
+        listing = bid_scenario["listing"]
 
         headers = auth_headers(
-            user_id=str(bidder_user.id),
+            user_id=bidder_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(bidder_company.id),
-        )
-
-        # Act - First bid
-        response1 = await test_client.post(
-            "/v1/bid/",
-            headers=headers,
-            json={
-                "listingId": str(listing.id),
-                "amount": 10000.00,
-                "currency": "USD",
-            },
-        )
-
-        # Act - Second bid
-        response2 = await test_client.post(
-            "/v1/bid/",
-            headers=headers,
-            json={
-                "listingId": str(listing.id),
-                "amount": 15000.00,
-                "currency": "USD",
-            },
+            company_id=bidder_company.id_str,
+        )
+
+        # Act - Both bids concurrently
+        response1, response2 = await asyncio.gather(
+            test_client.post(
+                "/v1/bid/",
+                headers=headers,
+                json={
+                    "listingId": listing.id_str,
+                    "amount": 10000.00,
+                    "currency": "USD",
+                },
+            ),
+            test_client.post(
+                "/v1/bid/",
+                headers=headers,
+                json={
+                    "listingId": listing.id_str,
+                    "amount": 15000.00,
+                    "currency": "USD",
+                },
+            ),
         )
 
         # Assert
@@ -822,39 +544,36 @@ class TestCreateBid:
         assert data2["amount"] == 15000.00
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_create_bid_without_permission_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test create bid without UPDATE.INSTRUMENT permission returns 403.
 
-        Arrange: Create listing and buyer user.
+        Arrange: Create a buyer user in the scenario's bidder company.
         Act: POST /v1/bid with buyer auth.
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
+        from tests.factories import UserFactory
+
+        bidder_company = bid_scenario["bidder_company"]
         bidder_buyer = await UserFactory.create(
             db_session, bidder_company, role=UserRole.BUYER
         )
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        await db_session.commit()
+        listing = bid_scenario["listing"]
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(bidder_buyer.id),
+            user_id=bidder_buyer.id_str,
             role=UserRole.BUYER,
-            company_id=str(bidder_company.id),
+            company_id=bidder_company.id_str,
         )
 
         # Act
@@ -862,7 +581,7 @@ class TestCreateBid:
             "/v1/bid/",
             headers=headers,
             json={
-                "listingId": str(listing.id),
+                "listingId": listing.id_str,
                 "amount": 10000.00,
                 "currency": "USD",
             },
@@ -872,257 +591,110 @@ class TestCreateBid:
         assert response.status_code == 403
 
 
-class TestBidStatusTransition:
-    """Tests for POST /v1/bid/{bid_id}/transition endpoint."""
-
-    @pytest.mark.asyncio
-    async def test_transition_pending_to_withdrawn_by_bidder_company(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test bidder company can transition PENDING to WITHDRAWN.
-
-        Arrange: Create PENDING bid.
-        Act: POST /v1/bid/{id}/transition with WITHDRAWN status by bidder.
-        Assert: Status is changed to WITHDRAWN.
-        """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(bidder_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(bidder_company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            f"/v1/bid/{bid.id}/transition",
-            headers=headers,
-            json={"status": "WITHDRAWN"},
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "WITHDRAWN"
-
-    @pytest.mark.asyncio
-    async def test_transition_pending_to_suspended_by_admin(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test admin can transition PENDING to SUSPENDED.
-
-        Arrange: Create PENDING bid.
-        Act: POST /v1/bid/{id}/transition with SUSPENDED status by admin.
-        Assert: Status is changed to SUSPENDED.
-        """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, seller_company)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(seller_company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            f"/v1/bid/{bid.id}/transition",
-            headers=headers,
-            json={"status": "SUSPENDED"},
-        )
+# Actor name -> (user key, role, company key) in the bid_scenario fixture
+_TRANSITION_ACTORS = {
+    "bidder": ("bidder_user", UserRole.ISSUER, "bidder_company"),
+    "admin": ("admin", UserRole.ADMIN, "seller_company"),
+    "other": ("other_user", UserRole.ISSUER, "other_company"),
+}
 
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "SUSPENDED"
-
-    @pytest.mark.asyncio
-    async def test_transition_withdrawn_to_suspended_by_admin(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test admin can transition WITHDRAWN to SUSPENDED.
-
-        Arrange: Create WITHDRAWN bid.
-        Act: POST /v1/bid/{id}/transition with SUSPENDED status by admin.
-        Assert: Status is changed to SUSPENDED.
-        """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, seller_company)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_withdrawn(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
 
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(seller_company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            f"/v1/bid/{bid.id}/transition",
-            headers=headers,
-            json={"status": "SUSPENDED"},
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "SUSPENDED"
-
-    @pytest.mark.asyncio
-    async def test_transition_pending_to_suspended_by_company_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test company user cannot transition PENDING to SUSPENDED.
-
-        Arrange: Create PENDING bid.
-        Act: POST /v1/bid/{id}/transition with SUSPENDED status by company user.
-        Assert: Response is 403 Forbidden.
-        """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(bidder_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(bidder_company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            f"/v1/bid/{bid.id}/transition",
-            headers=headers,
-            json={"status": "SUSPENDED"},
-        )
-
-        # Assert
-        assert response.status_code == 403
+class TestBidStatusTransition:
+    """Tests for POST /v1/bid/{bid_id}/transition endpoint."""
 
     @pytest.mark.asyncio
-    async def test_transition_by_non_bidder_company_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+    @pytest.mark.parametrize(
+        "initial_bid, actor, target_status, expected_status",
+        [
+            pytest.param(
+                "pending_bid",
+                "bidder",
+                "WITHDRAWN",
+                200,
+                id="pending_to_withdrawn_by_bidder_company",
+            ),
+            pytest.param(
+                "pending_bid",
+                "admin",
+                "SUSPENDED",
+                200,
+                id="pending_to_suspended_by_admin",
+            ),
+            pytest.param(
+                "withdrawn_bid",
+                "admin",
+                "SUSPENDED",
+                200,
+                id="withdrawn_to_suspended_by_admin",
+            ),
+            pytest.param(
+                "pending_bid",
+                "bidder",
+                "SUSPENDED",
+                403,
+                id="pending_to_suspended_by_company_returns_403",
+                marks=pytest.mark.negative,
+            ),
+            pytest.param(
+                "pending_bid",
+                "other",
+                "WITHDRAWN",
+                403,
+                id="by_non_bidder_company_returns_403",
+                marks=pytest.mark.negative,
+            ),
+        ],
+    )
+    async def test_transition(
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        auth_headers,
+        bid_scenario,
+        initial_bid,
+        actor,
+        target_status,
+        expected_status,
     ):
         """
-        Test user from different company cannot transition bid.
+        Test who may move a bid to which status.
 
-        Arrange: Create bid, user from third company.
-        Act: POST /v1/bid/{id}/transition by non-bidder company.
-        Assert: Response is 403 Forbidden.
+        Arrange: Take the class's shared bid in the case's initial status
+                 and the actor (bidder issuer, seller-company admin or an
+                 issuer from an unrelated company) from the scenario.
+        Act: POST /v1/bid/{id}/transition with the target status.
+        Assert: Response has the expected status code; on success the bid
+                has the target status.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        other_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-        other_user = await UserFactory.create_issuer(db_session, other_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
-
+        bid = bid_scenario[initial_bid]
+        user_key, role, company_key = _TRANSITION_ACTORS[actor]
         headers = auth_headers(
-            user_id=str(other_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(other_company.id),
+            user_id=bid_scenario[user_key].id_str,
+            role=role,
+            company_id=bid_scenario[company_key].id_str,
         )
 
         # Act
         response = await test_client.post(
             f"/v1/bid/{bid.id}/transition",
             headers=headers,
-            json={"status": "WITHDRAWN"},
+            json={"status": target_status},
         )
 
         # Assert
-        assert response.status_code == 403
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            assert response.json()["status"] == target_status
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_transition_on_non_open_listing_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test transition fails when listing is not OPEN.
@@ -1132,17 +704,14 @@ class TestBidStatusTransition:
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        from tests.factories import BidFactory, ListingFactory
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
+        seller_company = bid_scenario["seller_company"]
+        bidder_company = bid_scenario["bidder_company"]
+        seller_user = bid_scenario["seller_user"]
+        bidder_user = bid_scenario["bidder_user"]
+
+        instrument = bid_scenario["instrument"]
         # Create as OPEN first, then we'll change it
         listing = await ListingFactory.create(
             db_session, instrument, seller_company, seller_user, status=ListingStatus.OPEN
@@ -1152,12 +721,12 @@ class TestBidStatusTransition:
         )
         # Now change the listing to WITHDRAWN
         listing.status = ListingStatus.WITHDRAWN
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(bidder_user.id),
+            user_id=bidder_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(bidder_company.id),
+            company_id=bidder_company.id_str,
         )
 
         # Act
@@ -1173,31 +742,23 @@ class TestBidStatusTransition:
         assert "not open" in data["detail"].lower()
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_transition_nonexistent_bid_returns_404(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, seller_headers
     ):
         """
         Test transition on non-existent bid returns 404.
 
-        Arrange: Create company and user for auth.
+        Arrange: Use the seeded seller's headers; identity does not matter.
         Act: POST /v1/bid/{fake_id}/transition.
         Assert: Response is 404 Not Found.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        user = await UserFactory.create_issuer(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(user.id),
-            role=UserRole.ISSUER,
-            company_id=str(company.id),
-        )
-        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        headers = seller_headers
 
         # Act
         response = await test_client.post(
-            f"/v1/bid/{fake_uuid}/transition",
+            f"/v1/bid/{FAKE_UUID}/transition",
             headers=headers,
             json={"status": "WITHDRAWN"},
         )
@@ -1211,39 +772,29 @@ class TestAcceptBid:
 
     @pytest.mark.asyncio
     async def test_accept_bid_success(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test accept bid sets status to SELECTED.
 
-        Arrange: Create PENDING bid.
+        Arrange: Use the class's shared PENDING bid.
         Act: POST /v1/bid/{id}/accept by seller company.
         Assert: Bid status is SELECTED.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        seller_company = bid_scenario["seller_company"]
+        seller_user = bid_scenario["seller_user"]
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
+        bid = bid_scenario["pending_bid"]
 
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_company.id_str,
         )
 
         # Act
@@ -1259,44 +810,44 @@ class TestAcceptBid:
 
     @pytest.mark.asyncio
     async def test_accept_bid_rejects_other_pending_bids(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test accepting a bid sets other PENDING bids to NOT_SELECTED.
 
         Arrange: Create multiple PENDING bids.
         Act: POST /v1/bid/{id}/accept on one bid.
-        Assert: Other bids are set to NOT_SELECTED.
+        Assert: Other bids, including the class's shared PENDING bid, are
+                NOT_SELECTED in the database.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company1 = await CompanyFactory.create(db_session)
-        bidder_company2 = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user1 = await UserFactory.create_issuer(db_session, bidder_company1)
-        bidder_user2 = await UserFactory.create_issuer(db_session, bidder_company2)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
+        from app.models.bid import Bid
+        from tests.factories import BidFactory
+
+        seller_company = bid_scenario["seller_company"]
+        bidder_company1 = bid_scenario["bidder_company"]
+        bidder_company2 = bid_scenario["other_company"]
+        seller_user = bid_scenario["seller_user"]
+        bidder_user1 = bid_scenario["bidder_user"]
+        bidder_user2 = bid_scenario["other_user"]
+
+        listing = bid_scenario["listing"]
         bid1 = await BidFactory.create_pending(
             db_session, listing, bidder_company1, bidder_user1, amount=10000.00
         )
         bid2 = await BidFactory.create_pending(
             db_session, listing, bidder_company2, bidder_user2, amount=15000.00
         )
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_company.id_str,
         )
 
         # Act - Accept bid1
@@ -1310,47 +861,39 @@ class TestAcceptBid:
         data = response.json()
         assert data["status"] == "SELECTED"
 
-        # Check bid2 is NOT_SELECTED
-        response2 = await test_client.get(f"/v1/bid/{bid2.id}", headers=headers)
-        assert response2.status_code == 200
-        data2 = response2.json()
-        assert data2["status"] == "NOT_SELECTED"
+        # Check bid2 and the class's shared PENDING bid are NOT_SELECTED
+        other_ids = [bid2.id, bid_scenario["pending_bid"].id]
+        statuses = await db_session.scalars(
+            select(Bid.status).where(Bid.id.in_(other_ids))
+        )
+        assert statuses.all() == [BidStatus.NOT_SELECTED] * 2
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_accept_bid_by_non_seller_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test accept bid by non-seller company returns 403.
 
-        Arrange: Create bid, attempt accept by bidder company.
+        Arrange: Use the shared PENDING bid, attempt accept by bidder company.
         Act: POST /v1/bid/{id}/accept by bidder company.
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        bidder_company = bid_scenario["bidder_company"]
+        bidder_user = bid_scenario["bidder_user"]
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
+        bid = bid_scenario["pending_bid"]
 
         headers = auth_headers(
-            user_id=str(bidder_user.id),
+            user_id=bidder_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(bidder_company.id),
+            company_id=bidder_company.id_str,
         )
 
         # Act
@@ -1365,40 +908,31 @@ class TestAcceptBid:
         assert "listing owner" in data["detail"].lower()
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_accept_non_pending_bid_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test accept non-PENDING bid returns 403.
 
-        Arrange: Create WITHDRAWN bid.
+        Arrange: Use the class's shared WITHDRAWN bid.
         Act: POST /v1/bid/{id}/accept.
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        seller_company = bid_scenario["seller_company"]
+        seller_user = bid_scenario["seller_user"]
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_withdrawn(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
+        bid = bid_scenario["withdrawn_bid"]
 
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_company.id_str,
         )
 
         # Act
@@ -1413,8 +947,13 @@ class TestAcceptBid:
         assert "PENDING" in data["detail"]
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_accept_bid_on_non_open_listing_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test accept bid fails when listing is not OPEN.
@@ -1424,17 +963,14 @@ class TestAcceptBid:
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        from tests.factories import BidFactory, ListingFactory
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
+        seller_company = bid_scenario["seller_company"]
+        bidder_company = bid_scenario["bidder_company"]
+        seller_user = bid_scenario["seller_user"]
+        bidder_user = bid_scenario["bidder_user"]
+
+        instrument = bid_scenario["instrument"]
         listing = await ListingFactory.create(
             db_session, instrument, seller_company, seller_user, status=ListingStatus.OPEN
         )
@@ -1442,12 +978,12 @@ class TestAcceptBid:
             db_session, listing, bidder_company, bidder_user
         )
         listing.status = ListingStatus.WITHDRAWN
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_company.id_str,
         )
 
         # Act
@@ -1462,31 +998,23 @@ class TestAcceptBid:
         assert "not open" in data["detail"].lower()
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_accept_nonexistent_bid_returns_404(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, seller_headers
     ):
         """
         Test accept non-existent bid returns 404.
 
-        Arrange: Create company and user for auth.
+        Arrange: Use the seeded seller's headers; identity does not matter.
         Act: POST /v1/bid/{fake_id}/accept.
         Assert: Response is 404 Not Found.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        user = await UserFactory.create_issuer(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(user.id),
-            role=UserRole.ISSUER,
-            company_id=str(company.id),
-        )
-        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        headers = seller_headers
 
         # Act
         response = await test_client.post(
-            f"/v1/bid/{fake_uuid}/accept",
+            f"/v1/bid/{FAKE_UUID}/accept",
             headers=headers,
         )
 
@@ -1499,39 +1027,29 @@ class TestRejectBid:
 
     @pytest.mark.asyncio
     async def test_reject_bid_success(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test reject bid sets status to NOT_SELECTED.
 
-        Arrange: Create PENDING bid.
+        Arrange: Use the class's shared PENDING bid.
         Act: POST /v1/bid/{id}/reject by seller company.
         Assert: Bid status is NOT_SELECTED.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        seller_company = bid_scenario["seller_company"]
+        seller_user = bid_scenario["seller_user"]
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
+        bid = bid_scenario["pending_bid"]
 
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_company.id_str,
         )
 
         # Act
@@ -1547,44 +1065,44 @@ class TestRejectBid:
 
     @pytest.mark.asyncio
     async def test_reject_bid_does_not_affect_other_bids(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test rejecting a bid does not affect other pending bids.
 
         Arrange: Create multiple PENDING bids.
         Act: POST /v1/bid/{id}/reject on one bid.
-        Assert: Other bids remain PENDING.
+        Assert: Other bids, including the class's shared PENDING bid,
+                remain PENDING in the database.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company1 = await CompanyFactory.create(db_session)
-        bidder_company2 = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user1 = await UserFactory.create_issuer(db_session, bidder_company1)
-        bidder_user2 = await UserFactory.create_issuer(db_session, bidder_company2)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
+        from app.models.bid import Bid
+        from tests.factories import BidFactory
+
+        seller_company = bid_scenario["seller_company"]
+        bidder_company1 = bid_scenario["bidder_company"]
+        bidder_company2 = bid_scenario["other_company"]
+        seller_user = bid_scenario["seller_user"]
+        bidder_user1 = bid_scenario["bidder_user"]
+        bidder_user2 = bid_scenario["other_user"]
+
+        listing = bid_scenario["listing"]
         bid1 = await BidFactory.create_pending(
             db_session, listing, bidder_company1, bidder_user1, amount=10000.00
         )
         bid2 = await BidFactory.create_pending(
             db_session, listing, bidder_company2, bidder_user2, amount=15000.00
         )
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_company.id_str,
         )
 
         # Act - Reject bid1
@@ -1598,47 +1116,39 @@ class TestRejectBid:
         data = response.json()
         assert data["status"] == "NOT_SELECTED"
 
-        # Check bid2 is still PENDING
-        response2 = await test_client.get(f"/v1/bid/{bid2.id}", headers=headers)
-        assert response2.status_code == 200
-        data2 = response2.json()
-        assert data2["status"] == "PENDING"
+        # Check bid2 and the class's shared PENDING bid are still PENDING
+        other_ids = [bid2.id, bid_scenario["pending_bid"].id]
+        statuses = await db_session.scalars(
+            select(Bid.status).where(Bid.id.in_(other_ids))
+        )
+        assert statuses.all() == [BidStatus.PENDING] * 2
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_reject_bid_by_non_seller_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        auth_headers,
+        bid_scenario,
     ):
         """
         Test reject bid by non-seller company returns 403.
 
-        Arrange: Create bid, attempt reject by bidder company.
+        Arrange: Use the shared PENDING bid, attempt reject by bidder company.
         Act: POST /v1/bid/{id}/reject by bidder company.
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        bidder_company = bid_scenario["bidder_company"]
+        bidder_user = bid_scenario["bidder_user"]
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
+        bid = bid_scenario["pending_bid"]
 
         headers = auth_headers(
-            user_id=str(bidder_user.id),
+            user_id=bidder_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(bidder_company.id),
+            company_id=bidder_company.id_str,
         )
 
         # Act
@@ -1653,89 +1163,64 @@ class TestRejectBid:
         assert "listing owner" in data["detail"].lower()
 
     @pytest.mark.asyncio
-    async def test_reject_non_pending_bid_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+    @pytest.mark.negative
+    @pytest.mark.parametrize(
+        "listing_status, bid_status, detail",
+        [
+            pytest.param(
+                ListingStatus.OPEN,
+                BidStatus.SELECTED,
+                "PENDING",
+                id="non_pending_bid",
+            ),
+            pytest.param(
+                ListingStatus.SUSPENDED,
+                BidStatus.PENDING,
+                "not open",
+                id="non_open_listing",
+            ),
+        ],
+    )
+    async def test_reject_by_seller_returns_403(
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        bid_scenario,
+        listing_status,
+        bid_status,
+        detail,
     ):
         """
-        Test reject non-PENDING bid returns 403.
+        Test the seller cannot reject a bid in the wrong state.
 
-        Arrange: Create SELECTED bid.
-        Act: POST /v1/bid/{id}/reject.
-        Assert: Response is 403 Forbidden.
+        Arrange: Create a listing and bid in the case's statuses (a SELECTED
+                 bid, or a PENDING bid on a SUSPENDED listing).
+        Act: POST /v1/bid/{id}/reject by seller company.
+        Assert: Response is 403 Forbidden with the case's detail.
         """
         # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
+        from tests.factories import BidFactory, ListingFactory
 
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create_open(
-            db_session, instrument, seller_company, seller_user
-        )
-        bid = await BidFactory.create_selected(
-            db_session, listing, bidder_company, bidder_user
-        )
-        await db_session.commit()
+        seller_company = bid_scenario["seller_company"]
+        bidder_company = bid_scenario["bidder_company"]
+        seller_user = bid_scenario["seller_user"]
+        bidder_user = bid_scenario["bidder_user"]
 
-        headers = auth_headers(
-            user_id=str(seller_user.id),
-            role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+        instrument = bid_scenario["instrument"]
+        listing = ListingFactory.build(
+            instrument, seller_company, seller_user, status=listing_status
         )
-
-        # Act
-        response = await test_client.post(
-            f"/v1/bid/{bid.id}/reject",
-            headers=headers,
+        bid = BidFactory.build(
+            listing, bidder_company, bidder_user, status=bid_status
         )
-
-        # Assert
-        assert response.status_code == 403
-        data = response.json()
-        assert "PENDING" in data["detail"]
-
-    @pytest.mark.asyncio
-    async def test_reject_bid_on_non_open_listing_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test reject bid fails when listing is not OPEN.
-
-        Arrange: Create bid on SUSPENDED listing.
-        Act: POST /v1/bid/{id}/reject.
-        Assert: Response is 403 Forbidden.
-        """
-        # Arrange
-        seller_company = await CompanyFactory.create(db_session)
-        bidder_company = await CompanyFactory.create(db_session)
-        seller_user = await UserFactory.create_issuer(db_session, seller_company)
-        bidder_user = await UserFactory.create_issuer(db_session, bidder_company)
-
-        instrument = await InstrumentFactory.create_active(
-            db_session, seller_company, seller_user
-        )
-        await InstrumentOwnershipFactory.create_active(
-            db_session, instrument, seller_company
-        )
-        listing = await ListingFactory.create(
-            db_session, instrument, seller_company, seller_user, status=ListingStatus.OPEN
-        )
-        bid = await BidFactory.create_pending(
-            db_session, listing, bidder_company, bidder_user
-        )
-        listing.status = ListingStatus.SUSPENDED
-        await db_session.commit()
+        db_session.add_all([listing, bid])
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(seller_user.id),
+            user_id=seller_user.id_str,
             role=UserRole.ISSUER,
-            company_id=str(seller_company.id),
+            company_id=seller_company.id_str,
         )
 
         # Act
@@ -1747,34 +1232,26 @@ class TestRejectBid:
         # Assert
         assert response.status_code == 403
         data = response.json()
-        assert "not open" in data["detail"].lower()
+        assert detail.lower() in data["detail"].lower()
 
     @pytest.mark.asyncio
+    @pytest.mark.negative
     async def test_reject_nonexistent_bid_returns_404(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, seller_headers
     ):
         """
         Test reject non-existent bid returns 404.
 
-        Arrange: Create company and user for auth.
+        Arrange: Use the seeded seller's headers; identity does not matter.
         Act: POST /v1/bid/{fake_id}/reject.
         Assert: Response is 404 Not Found.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        user = await UserFactory.create_issuer(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(user.id),
-            role=UserRole.ISSUER,
-            company_id=str(company.id),
-        )
-        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        headers = seller_headers
 
         # Act
         response = await test_client.post(
-            f"/v1/bid/{fake_uuid}/reject",
+            f"/v1/bid/{FAKE_UUID}/reject",
             headers=headers,
         )
 
@@ -8,10 +8,13 @@ Tests company CRUD operations with various scenarios:
 - Create company
 """
 
+import asyncio
 from datetime import date
+from uuid import UUID
 
 import pytest
 from app.enums import UserRole
+from app.security import get_permissions_for_role
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from tests.factories import (
@@ -22,35 +25,40 @@ from tests.factories import (
 )
 
 
+def _role_can(role: UserRole, permission: str) -> bool:
+    """Whether the role's permission set grants ``permission`` (VERB.ENTITY)."""
+    return permission in get_permissions_for_role(role)
+
+
+def _expected_status(role: UserRole, permission: str) -> int:
+    """Status of a request guarded by ``permission`` made with ``role``."""
+    return 200 if _role_can(role, permission) else 403
+
+
 class TestGetAllCompanies:
     """Tests for GET /v1/company endpoint."""
 
     @pytest.mark.asyncio
     async def test_get_all_companies_with_admin_permission(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test admin can get all companies.
 
-        Arrange: Create multiple companies with admin user.
+        Arrange: Create multiple companies; use the seeded admin.
         Act: GET /v1/company with admin auth headers.
         Assert: Response is 200 with list of companies.
         """
         # Arrange
-        company1 = await CompanyFactory.create(
-            db_session, legal_name="Company Alpha"
-        )
-        company2 = await CompanyFactory.create(
-            db_session, legal_name="Company Beta"
+        db_session.add_all(
+            [
+                CompanyFactory.build(legal_name="Company Alpha"),
+                CompanyFactory.build(legal_name="Company Beta"),
+            ]
         )
-        admin = await UserFactory.create_admin(db_session, company1)
-        await db_session.commit()
+        await db_session.flush()
 
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.get("/v1/company/", headers=headers)
@@ -60,31 +68,23 @@ class TestGetAllCompanies:
         data = response.json()
         assert isinstance(data, list)
         assert len(data) >= 2
-        legal_names = [c["legalName"] for c in data]
+        legal_names = {c["legalName"] for c in data}
         assert "Company Alpha" in legal_names
         assert "Company Beta" in legal_names
 
     @pytest.mark.asyncio
     async def test_get_all_companies_returns_empty_list_when_no_companies(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers
     ):
         """
         Test get all companies returns empty list when no companies exist.
 
-        Arrange: Create company and admin (for auth), then delete company data.
+        Arrange: Use the seeded admin's headers.
         Act: GET /v1/company with admin auth.
         Assert: Response is 200 with list (may contain auth user's company).
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.get("/v1/company/", headers=headers)
@@ -95,38 +95,53 @@ class TestGetAllCompanies:
         assert isinstance(data, list)
 
     @pytest.mark.asyncio
-    async def test_get_all_companies_without_permission_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+    @pytest.mark.parametrize(
+        "role, expected_status",
+        [
+            pytest.param(
+                role,
+                _expected_status(role, "VIEW.COMPANY"),
+                id=role.value.lower(),
+            )
+            for role in (UserRole.ISSUER, UserRole.BUYER)
+        ],
+    )
+    async def test_get_all_companies_by_role(
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        admin_seed,
+        role,
+        expected_status,
     ):
         """
-        Test user without VIEW.COMPANY permission cannot get companies.
+        Test which non-admin roles may list companies.
 
-        Arrange: Create company and buyer user.
-        Act: GET /v1/company with buyer auth.
-        Assert: Response is 403 Forbidden.
+        Arrange: Create a user with the case's role in the seeded company.
+        Act: GET /v1/company with that user's auth.
+        Assert: Response status depends on the role's VIEW.COMPANY
+                permission in the permission matrix.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        buyer = await UserFactory.create(
-            db_session, company, role=UserRole.BUYER
-        )
-        await db_session.commit()
+        company = admin_seed["company"]
+        user = await UserFactory.create(db_session, company, role=role)
 
         headers = auth_headers(
-            user_id=str(buyer.id),
-            role=UserRole.BUYER,
-            company_id=str(company.id),
+            user_id=user.id_str,
+            role=role,
+            company_id=company.id_str,
         )
 
         # Act
         response = await test_client.get("/v1/company/", headers=headers)
 
-        # Assert - depends on permission matrix for BUYER
-        assert response.status_code in [200, 403]
+        # Assert
+        assert response.status_code == expected_status
 
     @pytest.mark.asyncio
     async def test_get_all_companies_returns_all_fields(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test get all companies returns all expected fields.
@@ -136,21 +151,16 @@ class TestGetAllCompanies:
         Assert: Response contains all expected fields.
         """
         # Arrange
-        company = await CompanyFactory.create(
+        await CompanyFactory.create(
             db_session,
             legal_name="Full Fields Company",
             trade_name="FFC Inc",
             registration_number="REG-123456",
             incorporation_date=date(2020, 6, 15),
         )
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
+        await db_session.flush()
 
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.get("/v1/company/", headers=headers)
@@ -168,41 +178,13 @@ class TestGetAllCompanies:
         assert "id" in our_company
         assert "createdAt" in our_company
 
-    @pytest.mark.asyncio
-    async def test_get_all_companies_with_issuer_permission(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test issuer can get all companies.
-
-        Arrange: Create company and issuer user.
-        Act: GET /v1/company with issuer auth.
-        Assert: Response is 200 with list of companies.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        issuer = await UserFactory.create_issuer(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(issuer.id),
-            role=UserRole.ISSUER,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.get("/v1/company/", headers=headers)
-
-        # Assert - ISSUER should have VIEW.COMPANY permission
-        assert response.status_code in [200, 403]
-
 
 class TestGetCompanyById:
     """Tests for GET /v1/company/{company_id} endpoint."""
 
     @pytest.mark.asyncio
     async def test_get_company_by_id_success(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test get company by ID returns company data.
@@ -218,18 +200,13 @@ class TestGetCompanyById:
             trade_name="FMC",
             registration_number="REG-FINDME",
         )
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
+        await db_session.flush()
 
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.get(
-            f"/v1/company/{company.id}", headers=headers
+            f"/v1/company/{company.id_str}", headers=headers
         )
 
         # Assert
@@ -238,29 +215,21 @@ class TestGetCompanyById:
         assert data["legalName"] == "Find Me Company"
         assert data["tradeName"] == "FMC"
         assert data["registrationNumber"] == "REG-FINDME"
-        assert data["id"] == str(company.id)
+        assert data["id"] == company.id_str
 
     @pytest.mark.asyncio
     async def test_get_company_by_nonexistent_id_returns_404(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers
     ):
         """
         Test get company by non-existent ID returns 404.
 
-        Arrange: Create company for auth.
+        Arrange: Use the seeded admin's headers.
         Act: GET /v1/company/{fake_uuid}.
         Assert: Response is 404 Not Found.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
         fake_uuid = "00000000-0000-0000-0000-000000000000"
 
         # Act
@@ -271,126 +240,38 @@ class TestGetCompanyById:
         # Assert
         assert response.status_code == 404
 
-    @pytest.mark.asyncio
-    async def test_get_company_by_id_with_addresses_include(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test get company by ID with addresses include returns addresses.
-
-        Arrange: Create company with addresses.
-        Act: GET /v1/company/{id}?include=addresses.
-        Assert: Response includes addresses array.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        address1 = await CompanyAddressFactory.create(
-            db_session, company, street="123 Main St"
-        )
-        address2 = await CompanyAddressFactory.create_billing(
-            db_session, company, street="456 Billing Ave"
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.get(
-            f"/v1/company/{company.id}?include=addresses", headers=headers
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert "addresses" in data
-        assert isinstance(data["addresses"], list)
-        assert len(data["addresses"]) == 2
-        streets = [a["street"] for a in data["addresses"]]
-        assert "123 Main St" in streets
-        assert "456 Billing Ave" in streets
-
-    @pytest.mark.asyncio
-    async def test_get_company_by_id_with_users_include(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test get company by ID with users include returns users.
-
-        Arrange: Create company with multiple users.
-        Act: GET /v1/company/{id}?include=users.
-        Assert: Response includes users array.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(
-            db_session, company, email="admin@company.com"
-        )
-        user1 = await UserFactory.create(
-            db_session, company, email="user1@company.com"
-        )
-        user2 = await UserFactory.create(
-            db_session, company, email="user2@company.com"
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.get(
-            f"/v1/company/{company.id}?include=users", headers=headers
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert "users" in data
-        assert isinstance(data["users"], list)
-        assert len(data["users"]) >= 3
-        emails = [u["email"] for u in data["users"]]
-        assert "admin@company.com" in emails
-        assert "user1@company.com" in emails
-        assert "user2@company.com" in emails
-
     @pytest.mark.asyncio
     async def test_get_company_by_id_with_instruments_include(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        admin_seed,
+        admin_headers,
     ):
         """
         Test get company by ID with instruments include returns instruments.
 
-        Arrange: Create company with instruments.
+        Arrange: Create company with instruments, created by the seeded
+                 admin.
         Act: GET /v1/company/{id}?include=instruments.
         Assert: Response includes instruments array with public_payload.
         """
         # Arrange
         company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
+        admin = admin_seed["admin"]
         instrument1 = await InstrumentFactory.create(
             db_session, company, admin, name="Instrument Alpha"
         )
         instrument2 = await InstrumentFactory.create(
             db_session, company, admin, name="Instrument Beta"
         )
-        await db_session.commit()
+        await db_session.flush()
 
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.get(
-            f"/v1/company/{company.id}?include=instruments", headers=headers
+            f"/v1/company/{company.id_str}?include=instruments", headers=headers
         )
 
         # Assert
@@ -399,7 +280,7 @@ class TestGetCompanyById:
         assert "instruments" in data
         assert isinstance(data["instruments"], list)
         assert len(data["instruments"]) == 2
-        names = [i["name"] for i in data["instruments"]]
+        names = {i["name"] for i in data["instruments"]}
         assert "Instrument Alpha" in names
         assert "Instrument Beta" in names
         # Verify that public_payload is included (nested relationship loading works)
@@ -413,45 +294,56 @@ class TestGetCompanyById:
         """
         Test get company by ID with multiple includes.
 
-        Arrange: Create company with addresses, users, and instruments.
+        Arrange: Create company with two addresses, three users and an
+                 instrument.
         Act: GET /v1/company/{id}?include=addresses,users,instruments.
-        Assert: Response includes all requested relations.
+        Assert: Response includes every requested relation with the
+                seeded rows.
         """
         # Arrange
         company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await CompanyAddressFactory.create(db_session, company)
+        admin = await UserFactory.create_admin(
+            db_session, company, email="admin@company.com"
+        )
+        await UserFactory.create(db_session, company, email="user1@company.com")
+        await UserFactory.create(db_session, company, email="user2@company.com")
+        await CompanyAddressFactory.create(
+            db_session, company, street="123 Main St"
+        )
+        await CompanyAddressFactory.create_billing(
+            db_session, company, street="456 Billing Ave"
+        )
         await InstrumentFactory.create(db_session, company, admin)
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(admin.id),
+            user_id=admin.id_str,
             role=UserRole.ADMIN,
-            company_id=str(company.id),
+            company_id=company.id_str,
         )
 
         # Act - include all relations (comma-separated values)
         response = await test_client.get(
-            f"/v1/company/{company.id}?include=addresses,users,instruments",
+            f"/v1/company/{company.id_str}?include=addresses,users,instruments",
             headers=headers,
         )
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert "addresses" in data
-        assert "users" in data
-        assert "instruments" in data
-        assert data["addresses"] is not None
-        assert data["users"] is not None
-        assert data["instruments"] is not None
-        assert len(data["addresses"]) >= 1
-        assert len(data["users"]) >= 1
-        assert len(data["instruments"]) >= 1
+        streets = {a["street"] for a in data["addresses"]}
+        assert streets == {"123 Main St", "456 Billing Ave"}
+        emails = {u["email"] for u in data["users"]}
+        assert emails == {
+            "admin@company.com",
+            "user1@company.com",
+            "user2@company.com",
+        }
+        assert len(data["instruments"]) == 1
 
     @pytest.mark.asyncio
     async def test_get_company_by_id_without_includes_returns_null_relations(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test get company by ID without includes returns null for relations.
@@ -462,19 +354,14 @@ class TestGetCompanyById:
         """
         # Arrange
         company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
         await CompanyAddressFactory.create(db_session, company)
-        await db_session.commit()
+        await db_session.flush()
 
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.get(
-            f"/v1/company/{company.id}", headers=headers
+            f"/v1/company/{company.id_str}", headers=headers
         )
 
         # Assert
@@ -487,25 +374,17 @@ class TestGetCompanyById:
 
     @pytest.mark.asyncio
     async def test_get_company_by_id_invalid_uuid_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers
     ):
         """
         Test get company with invalid UUID format returns 422.
 
-        Arrange: Create company for auth.
+        Arrange: Use the seeded admin's headers.
         Act: GET /v1/company/invalid-uuid.
         Assert: Response is 422 Unprocessable Entity.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.get(
@@ -521,30 +400,17 @@ class TestSearchCompanies:
 
     @pytest.mark.asyncio
     async def test_search_companies_returns_all_with_empty_filters(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers, company_catalog
     ):
         """
         Test search companies with empty filters returns all companies.
 
-        Arrange: Create multiple companies.
+        Arrange: Use the class's company catalog.
         Act: POST /v1/company/search with empty body.
         Assert: Response contains all companies.
         """
         # Arrange
-        company1 = await CompanyFactory.create(
-            db_session, legal_name="Search Company One"
-        )
-        company2 = await CompanyFactory.create(
-            db_session, legal_name="Search Company Two"
-        )
-        admin = await UserFactory.create_admin(db_session, company1)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -555,37 +421,21 @@ class TestSearchCompanies:
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
-        assert len(data) >= 2
+        assert len(data) >= len(company_catalog)
 
     @pytest.mark.asyncio
     async def test_search_companies_by_legal_name(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers, company_catalog
     ):
         """
         Test search companies by legal name filter.
 
-        Arrange: Create companies with different legal names.
+        Arrange: Use the class's company catalog.
         Act: POST /v1/company/search with legalName filter.
         Assert: Response contains matching companies.
         """
         # Arrange
-        company1 = await CompanyFactory.create(
-            db_session, legal_name="Alpha Corporation"
-        )
-        company2 = await CompanyFactory.create(
-            db_session, legal_name="Beta Industries"
-        )
-        company3 = await CompanyFactory.create(
-            db_session, legal_name="Alpha Holdings"
-        )
-        admin = await UserFactory.create_admin(db_session, company1)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -597,42 +447,26 @@ class TestSearchCompanies:
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) >= 2
-        legal_names = [c["legalName"] for c in data]
-        assert "Alpha Corporation" in legal_names
-        assert "Alpha Holdings" in legal_names
-        assert "Beta Industries" not in legal_names
+        expected = {
+            c.legal_name
+            for c in company_catalog
+            if "alpha" in c.legal_name.lower()
+        }
+        assert {c["legalName"] for c in data} == expected
 
     @pytest.mark.asyncio
     async def test_search_companies_by_trade_name(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers, company_catalog
     ):
         """
         Test search companies by trade name filter.
 
-        Arrange: Create companies with different trade names.
+        Arrange: Use the class's company catalog.
         Act: POST /v1/company/search with tradeName filter.
         Assert: Response contains matching companies.
         """
         # Arrange
-        company1 = await CompanyFactory.create(
-            db_session,
-            legal_name="Legal Name One",
-            trade_name="TechCorp",
-        )
-        company2 = await CompanyFactory.create(
-            db_session,
-            legal_name="Legal Name Two",
-            trade_name="FinanceHub",
-        )
-        admin = await UserFactory.create_admin(db_session, company1)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -644,36 +478,23 @@ class TestSearchCompanies:
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) >= 1
-        trade_names = [c.get("tradeName") for c in data]
+        assert len(data) == 1
+        trade_names = {c.get("tradeName") for c in data}
         assert "TechCorp" in trade_names
 
     @pytest.mark.asyncio
     async def test_search_companies_by_registration_number(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers, company_catalog
     ):
         """
         Test search companies by registration number filter.
 
-        Arrange: Create companies with different registration numbers.
+        Arrange: Use the class's company catalog.
         Act: POST /v1/company/search with registrationNumber filter.
         Assert: Response contains matching companies.
         """
         # Arrange
-        company1 = await CompanyFactory.create(
-            db_session, registration_number="REG-2024-001"
-        )
-        company2 = await CompanyFactory.create(
-            db_session, registration_number="REG-2023-999"
-        )
-        admin = await UserFactory.create_admin(db_session, company1)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -686,44 +507,22 @@ class TestSearchCompanies:
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 1
-        reg_numbers = [c["registrationNumber"] for c in data]
+        reg_numbers = {c["registrationNumber"] for c in data}
         assert "REG-2024-001" in reg_numbers
 
     @pytest.mark.asyncio
     async def test_search_companies_by_incorporation_date_range(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers, company_catalog
     ):
         """
         Test search companies by incorporation date range.
 
-        Arrange: Create companies with different incorporation dates.
+        Arrange: Use the class's company catalog.
         Act: POST /v1/company/search with date range filters.
         Assert: Response contains companies within date range.
         """
         # Arrange
-        company1 = await CompanyFactory.create(
-            db_session,
-            legal_name="Old Company",
-            incorporation_date=date(2018, 1, 15),
-        )
-        company2 = await CompanyFactory.create(
-            db_session,
-            legal_name="New Company",
-            incorporation_date=date(2023, 6, 20),
-        )
-        company3 = await CompanyFactory.create(
-            db_session,
-            legal_name="Mid Company",
-            incorporation_date=date(2020, 12, 1),
-        )
-        admin = await UserFactory.create_admin(db_session, company1)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        headers = admin_headers
 
         # Act - Search for companies incorporated in 2020 or later
         response = await test_client.post(
@@ -735,36 +534,24 @@ class TestSearchCompanies:
         # Assert
         assert response.status_code == 200
         data = response.json()
-        legal_names = [c["legalName"] for c in data]
+        legal_names = {c["legalName"] for c in data}
         assert "New Company" in legal_names
         assert "Mid Company" in legal_names
         assert "Old Company" not in legal_names
 
     @pytest.mark.asyncio
     async def test_search_companies_pagination_limit(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers, company_catalog
     ):
         """
         Test search companies with limit pagination.
 
-        Arrange: Create multiple companies.
+        Arrange: Use the class's company catalog.
         Act: POST /v1/company/search with limit.
         Assert: Response contains limited number of companies.
         """
         # Arrange
-        company1 = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company1)
-        for i in range(5):
-            await CompanyFactory.create(
-                db_session, legal_name=f"Pagination Company {i}"
-            )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -780,42 +567,30 @@ class TestSearchCompanies:
 
     @pytest.mark.asyncio
     async def test_search_companies_pagination_offset(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers, company_catalog
     ):
         """
         Test search companies with offset pagination.
 
-        Arrange: Create multiple companies.
+        Arrange: Use the class's company catalog.
         Act: POST /v1/company/search with limit and offset.
         Assert: Response skips first N companies.
         """
         # Arrange
-        company1 = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company1)
-        for i in range(5):
-            await CompanyFactory.create(
-                db_session, legal_name=f"Offset Company {i}"
-            )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
-
-        # Act - Get first page
-        response1 = await test_client.post(
-            "/v1/company/search",
-            headers=headers,
-            json={"limit": 2, "offset": 0},
-        )
-
-        # Get second page
-        response2 = await test_client.post(
-            "/v1/company/search",
-            headers=headers,
-            json={"limit": 2, "offset": 2},
+        headers = admin_headers
+
+        # Act - Get the first two pages concurrently
+        response1, response2 = await asyncio.gather(
+            test_client.post(
+                "/v1/company/search",
+                headers=headers,
+                json={"limit": 2, "offset": 0},
+            ),
+            test_client.post(
+                "/v1/company/search",
+                headers=headers,
+                json={"limit": 2, "offset": 2},
+            ),
         )
 
         # Assert
@@ -832,33 +607,17 @@ class TestSearchCompanies:
 
     @pytest.mark.asyncio
     async def test_search_companies_sorting_by_legal_name_ascending(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers, company_catalog
     ):
         """
         Test search companies with ascending sort by legal name.
 
-        Arrange: Create companies with different names.
+        Arrange: Use the class's company catalog.
         Act: POST /v1/company/search with sort=legalName.
         Assert: Response is sorted alphabetically.
         """
         # Arrange
-        company_c = await CompanyFactory.create(
-            db_session, legal_name="Charlie Corp"
-        )
-        company_a = await CompanyFactory.create(
-            db_session, legal_name="Alpha Corp"
-        )
-        company_b = await CompanyFactory.create(
-            db_session, legal_name="Bravo Corp"
-        )
-        admin = await UserFactory.create_admin(db_session, company_a)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company_a.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -872,30 +631,23 @@ class TestSearchCompanies:
         data = response.json()
         legal_names = [c["legalName"] for c in data]
         # Filter to only our test companies
-        test_names = [n for n in legal_names if n in ["Alpha Corp", "Bravo Corp", "Charlie Corp"]]
-        assert test_names == sorted(test_names)
+        corp_names = {"Alpha Corp", "Bravo Corp", "Charlie Corp"}
+        test_names = [n for n in legal_names if n in corp_names]
+        assert test_names == sorted(corp_names)
 
     @pytest.mark.asyncio
     async def test_search_companies_sorting_descending(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers
     ):
         """
         Test search companies with descending sort.
 
-        Arrange: Create companies.
+        Arrange: Use the seeded admin's headers.
         Act: POST /v1/company/search with sort=-created_at.
         Assert: Response is sorted by created_at descending.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -910,6 +662,10 @@ class TestSearchCompanies:
         assert isinstance(data, list)
 
     @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        _role_can(UserRole.BUYER, "VIEW.COMPANY"),
+        reason="BUYER has VIEW.COMPANY in the permission matrix",
+    )
     async def test_search_companies_without_permission_returns_403(
         self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
     ):
@@ -921,16 +677,15 @@ class TestSearchCompanies:
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        buyer = await UserFactory.create(
-            db_session, company, role=UserRole.BUYER
-        )
-        await db_session.commit()
+        company = CompanyFactory.build()
+        buyer = UserFactory.build(company, role=UserRole.BUYER)
+        db_session.add_all([company, buyer])
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(buyer.id),
+            user_id=buyer.id_str,
             role=UserRole.BUYER,
-            company_id=str(company.id),
+            company_id=company.id_str,
         )
 
         # Act
@@ -938,47 +693,22 @@ class TestSearchCompanies:
             "/v1/company/search", headers=headers, json={}
         )
 
-        # Assert - depends on permission matrix
-        assert response.status_code in [200, 403]
+        # Assert
+        assert response.status_code == 403
 
     @pytest.mark.asyncio
     async def test_search_companies_with_multiple_filters(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers, company_catalog
     ):
         """
         Test search companies with multiple filters combined.
 
-        Arrange: Create companies with various attributes.
+        Arrange: Use the class's company catalog.
         Act: POST /v1/company/search with multiple filters.
         Assert: Response contains companies matching all filters.
         """
         # Arrange
-        company1 = await CompanyFactory.create(
-            db_session,
-            legal_name="Tech Alpha",
-            trade_name="TA Inc",
-            incorporation_date=date(2022, 1, 1),
-        )
-        company2 = await CompanyFactory.create(
-            db_session,
-            legal_name="Tech Beta",
-            trade_name="TB Inc",
-            incorporation_date=date(2020, 1, 1),
-        )
-        company3 = await CompanyFactory.create(
-            db_session,
-            legal_name="Finance Alpha",
-            trade_name="FA Inc",
-            incorporation_date=date(2022, 6, 1),
-        )
-        admin = await UserFactory.create_admin(db_session, company1)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        headers = admin_headers
 
         # Act - Search for "Tech" companies incorporated in 2022 or later
         response = await test_client.post(
@@ -993,36 +723,67 @@ class TestSearchCompanies:
         # Assert
         assert response.status_code == 200
         data = response.json()
-        legal_names = [c["legalName"] for c in data]
+        legal_names = {c["legalName"] for c in data}
         assert "Tech Alpha" in legal_names
         # Tech Beta was incorporated in 2020, so it shouldn't be in results
         assert "Tech Beta" not in legal_names
 
+    @pytest.mark.asyncio
+    async def test_search_companies_parallel_smoke(
+        self, test_client: AsyncClient, admin_headers, company_catalog
+    ):
+        """
+        Test concurrent searches with different filters all succeed.
+
+        Quick check of the search endpoint (``-k parallel_smoke``) that
+        also exercises concurrent requests on the shared connection.
+
+        Arrange: Use the class's company catalog.
+        Act: POST /v1/company/search with six filter sets concurrently.
+        Assert: Every response is 200 with a list.
+        """
+        # Arrange
+        headers = admin_headers
+        bodies = [
+            {},
+            {"legalName": "Alpha"},
+            {"tradeName": "Tech"},
+            {"registrationNumber": "2024"},
+            {"incorporationDateAfter": "2020-01-01"},
+            {"limit": 2, "offset": 2},
+        ]
+
+        # Act
+        responses = await asyncio.gather(
+            *(
+                test_client.post(
+                    "/v1/company/search", headers=headers, json=body
+                )
+                for body in bodies
+            )
+        )
+
+        # Assert
+        assert [r.status_code for r in responses] == [200] * len(bodies)
+        assert all(isinstance(r.json(), list) for r in responses)
+
 
 class TestCreateCompany:
     """Tests for POST /v1/company endpoint."""
 
     @pytest.mark.asyncio
     async def test_create_company_success(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, savepoint, admin_headers
     ):
         """
         Test create company with valid data returns created company.
 
-        Arrange: Create existing company and admin for auth.
+        Arrange: Use the seeded admin's headers.
         Act: POST /v1/company with valid company data.
         Assert: Response is 200 with created company data.
         """
         # Arrange
-        existing_company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, existing_company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(existing_company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -1048,25 +809,17 @@ class TestCreateCompany:
 
     @pytest.mark.asyncio
     async def test_create_company_without_trade_name(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, savepoint, admin_headers
     ):
         """
         Test create company without optional trade name.
 
-        Arrange: Create company and admin for auth.
+        Arrange: Use the seeded admin's headers.
         Act: POST /v1/company without tradeName.
         Assert: Response is 200 with null tradeName.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -1086,141 +839,60 @@ class TestCreateCompany:
         assert data["tradeName"] is None
 
     @pytest.mark.asyncio
-    async def test_create_company_missing_required_field_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test create company without required field returns 422.
-
-        Arrange: Create company and admin for auth.
-        Act: POST /v1/company without legalName.
-        Assert: Response is 422 Unprocessable Entity.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act - Missing legalName
-        response = await test_client.post(
-            "/v1/company/",
-            headers=headers,
-            json={
-                "registrationNumber": "REG-MISSING",
-                "incorporationDate": "2024-01-01",
-            },
-        )
-
-        # Assert
-        assert response.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_create_company_missing_registration_number_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test create company without registration number returns 422.
-
-        Arrange: Create company and admin for auth.
-        Act: POST /v1/company without registrationNumber.
-        Assert: Response is 422 Unprocessable Entity.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            "/v1/company/",
-            headers=headers,
-            json={
-                "legalName": "Missing Reg Company",
-                "incorporationDate": "2024-01-01",
-            },
-        )
-
-        # Assert
-        assert response.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_create_company_missing_incorporation_date_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(
+                {
+                    "registrationNumber": "REG-MISSING",
+                    "incorporationDate": "2024-01-01",
+                },
+                id="missing_legal_name",
+            ),
+            pytest.param(
+                {
+                    "legalName": "Missing Reg Company",
+                    "incorporationDate": "2024-01-01",
+                },
+                id="missing_registration_number",
+            ),
+            pytest.param(
+                {
+                    "legalName": "Missing Date Company",
+                    "registrationNumber": "REG-NODATE",
+                },
+                id="missing_incorporation_date",
+            ),
+            pytest.param(
+                {
+                    "legalName": "Bad Date Company",
+                    "registrationNumber": "REG-BADDATE",
+                    "incorporationDate": "not-a-date",
+                },
+                id="invalid_date_format",
+            ),
+            pytest.param({}, id="empty_body"),
+        ],
+    )
+    async def test_create_company_invalid_payload_returns_422(
+        self, test_client: AsyncClient, admin_headers, payload
     ):
         """
-        Test create company without incorporation date returns 422.
+        Test create company with an invalid body returns 422.
 
-        Arrange: Create company and admin for auth.
-        Act: POST /v1/company without incorporationDate.
+        Arrange: Use the seeded admin's headers.
+        Act: POST /v1/company with the case's payload (a required field
+             missing, a malformed date, or an empty body).
         Assert: Response is 422 Unprocessable Entity.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
             "/v1/company/",
             headers=headers,
-            json={
-                "legalName": "Missing Date Company",
-                "registrationNumber": "REG-NODATE",
-            },
-        )
-
-        # Assert
-        assert response.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_create_company_invalid_date_format_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test create company with invalid date format returns 422.
-
-        Arrange: Create company and admin for auth.
-        Act: POST /v1/company with invalid date format.
-        Assert: Response is 422 Unprocessable Entity.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            "/v1/company/",
-            headers=headers,
-            json={
-                "legalName": "Bad Date Company",
-                "registrationNumber": "REG-BADDATE",
-                "incorporationDate": "not-a-date",
-            },
+            json=payload,
         )
 
         # Assert
@@ -1238,16 +910,15 @@ class TestCreateCompany:
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        buyer = await UserFactory.create(
-            db_session, company, role=UserRole.BUYER
-        )
-        await db_session.commit()
+        company = CompanyFactory.build()
+        buyer = UserFactory.build(company, role=UserRole.BUYER)
+        db_session.add_all([company, buyer])
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(buyer.id),
+            user_id=buyer.id_str,
             role=UserRole.BUYER,
-            company_id=str(company.id),
+            company_id=company.id_str,
         )
 
         # Act
@@ -1264,38 +935,6 @@ class TestCreateCompany:
         # Assert
         assert response.status_code == 403
 
-    @pytest.mark.asyncio
-    async def test_create_company_with_empty_body_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test create company with empty body returns 422.
-
-        Arrange: Create company and admin for auth.
-        Act: POST /v1/company with empty JSON body.
-        Assert: Response is 422 Unprocessable Entity.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            "/v1/company/",
-            headers=headers,
-            json={},
-        )
-
-        # Assert
-        assert response.status_code == 422
-
     @pytest.mark.asyncio
     async def test_create_company_with_issuer_permission(
         self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
@@ -1305,17 +944,18 @@ class TestCreateCompany:
 
         Arrange: Create company and issuer user.
         Act: POST /v1/company with issuer auth.
-        Assert: Response depends on permission matrix.
+        Assert: Response is 200 if ISSUER has CREATE.COMPANY, else 403.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        issuer = await UserFactory.create_issuer(db_session, company)
-        await db_session.commit()
+        company = CompanyFactory.build()
+        issuer = UserFactory.build(company, role=UserRole.ISSUER)
+        db_session.add_all([company, issuer])
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(issuer.id),
+            user_id=issuer.id_str,
             role=UserRole.ISSUER,
-            company_id=str(company.id),
+            company_id=company.id_str,
         )
 
         # Act
@@ -1329,30 +969,24 @@ class TestCreateCompany:
             },
         )
 
-        # Assert - depends on whether ISSUER has CREATE.COMPANY permission
-        assert response.status_code in [200, 403]
+        # Assert
+        assert response.status_code == _expected_status(
+            UserRole.ISSUER, "CREATE.COMPANY"
+        )
 
     @pytest.mark.asyncio
     async def test_create_company_returns_generated_id(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, savepoint, admin_headers
     ):
         """
         Test created company has a valid UUID id.
 
-        Arrange: Create company and admin for auth.
+        Arrange: Use the seeded admin's headers.
         Act: POST /v1/company with valid data.
         Assert: Response contains valid UUID id.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -1369,35 +1003,22 @@ class TestCreateCompany:
         assert response.status_code == 200
         data = response.json()
         assert "id" in data
-        # Validate UUID format (8-4-4-4-12 hex digits)
-        import re
-        uuid_pattern = re.compile(
-            r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-            re.IGNORECASE
-        )
-        assert uuid_pattern.match(data["id"])
+        # Canonical 8-4-4-4-12 form; UUID() raises on anything unparsable
+        assert str(UUID(data["id"])) == data["id"]
 
     @pytest.mark.asyncio
     async def test_create_multiple_companies_have_unique_ids(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, savepoint, admin_headers
     ):
         """
         Test creating multiple companies generates unique IDs.
 
-        Arrange: Create company and admin for auth.
+        Arrange: Use the seeded admin's headers.
         Act: POST /v1/company twice with different data.
         Assert: Both companies have different IDs.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response1 = await test_client.post(
@@ -6,6 +6,8 @@ Tests company address CRUD operations with various scenarios:
 - Create company address
 """
 
+import asyncio
+
 import pytest
 import pytest_asyncio
 from app.enums import AddressType, UserRole
@@ -19,7 +21,7 @@ class TestGetAllCompanyAddresses:
 
     @pytest.mark.asyncio
     async def test_get_all_company_addresses_success(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test get all company addresses returns list of addresses.
@@ -29,21 +31,21 @@ class TestGetAllCompanyAddresses:
         Assert: Response is 200 with list of addresses.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        address1 = await CompanyAddressFactory.create(
-            db_session, company, street="123 Main St"
-        )
-        address2 = await CompanyAddressFactory.create_billing(
-            db_session, company, street="456 Billing Ave"
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        company = CompanyFactory.build()
+        db_session.add_all(
+            [
+                company,
+                CompanyAddressFactory.build(company, street="123 Main St"),
+                CompanyAddressFactory.build(
+                    company,
+                    address_type=AddressType.BILLING,
+                    street="456 Billing Ave",
+                ),
+            ]
+        )
+        await db_session.flush()
+
+        headers = admin_headers
 
         # Act
         response = await test_client.get(
@@ -57,26 +59,19 @@ class TestGetAllCompanyAddresses:
         assert len(data) >= 2
 
     @pytest.mark.asyncio
+    @pytest.mark.requires_fresh_db
     async def test_get_all_company_addresses_empty_returns_empty_list(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test get all company addresses with no addresses returns empty list.
 
-        Arrange: Create company without any addresses.
+        Arrange: Use the seeded admin's headers on a fresh database.
         Act: GET /v1/company-address.
         Assert: Response is 200 with empty list.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.get(
@@ -91,7 +86,7 @@ class TestGetAllCompanyAddresses:
 
     @pytest.mark.asyncio
     async def test_get_all_company_addresses_returns_correct_fields(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test get all company addresses returns all expected fields.
@@ -101,10 +96,8 @@ class TestGetAllCompanyAddresses:
         Assert: Response contains all expected fields with correct values.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        address = await CompanyAddressFactory.create(
-            db_session,
+        company = CompanyFactory.build()
+        address = CompanyAddressFactory.build(
             company,
             address_type=AddressType.REGISTERED,
             street="789 Business Blvd",
@@ -113,13 +106,10 @@ class TestGetAllCompanyAddresses:
             postal_code="94102",
             country="US",
         )
-        await db_session.commit()
+        db_session.add_all([company, address])
+        await db_session.flush()
 
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.get(
@@ -141,11 +131,11 @@ class TestGetAllCompanyAddresses:
         assert created_address["state"] == "CA"
         assert created_address["postalCode"] == "94102"
         assert created_address["country"] == "US"
-        assert created_address["companyId"] == str(company.id)
+        assert created_address["companyId"] == company.id_str
 
     @pytest.mark.asyncio
     async def test_get_all_company_addresses_with_multiple_companies(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test get all company addresses returns addresses from all companies.
@@ -155,26 +145,23 @@ class TestGetAllCompanyAddresses:
         Assert: Response contains addresses from all companies.
         """
         # Arrange
-        company1 = await CompanyFactory.create(
-            db_session, legal_name="Company One"
-        )
-        company2 = await CompanyFactory.create(
-            db_session, legal_name="Company Two"
-        )
-        admin = await UserFactory.create_admin(db_session, company1)
-        address1 = await CompanyAddressFactory.create(
-            db_session, company1, street="Company One Street"
-        )
-        address2 = await CompanyAddressFactory.create(
-            db_session, company2, street="Company Two Street"
-        )
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        company1 = CompanyFactory.build(legal_name="Company One")
+        company2 = CompanyFactory.build(legal_name="Company Two")
+        db_session.add_all(
+            [
+                company1,
+                company2,
+                CompanyAddressFactory.build(
+                    company1, street="Company One Street"
+                ),
+                CompanyAddressFactory.build(
+                    company2, street="Company Two Street"
+                ),
+            ]
+        )
+        await db_session.flush()
+
+        headers = admin_headers
 
         # Act
         response = await test_client.get(
@@ -190,26 +177,30 @@ class TestGetAllCompanyAddresses:
 
     @pytest.mark.asyncio
     async def test_get_all_company_addresses_without_permission_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        admin_seed,
     ):
         """
         Test get all company addresses without VIEW.COMPANY_ADDRESS permission returns 403.
 
-        Arrange: Create company and user without permission.
+        Arrange: Create a buyer user in the seeded company.
         Act: GET /v1/company-address.
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
+        company = admin_seed["company"]
         buyer = await UserFactory.create(
             db_session, company, role=UserRole.BUYER
         )
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(buyer.id),
+            user_id=buyer.id_str,
             role=UserRole.BUYER,
-            company_id=str(company.id),
+            company_id=company.id_str,
         )
 
         # Act
@@ -222,7 +213,7 @@ class TestGetAllCompanyAddresses:
 
     @pytest.mark.asyncio
     async def test_get_all_company_addresses_with_different_types(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test get all company addresses returns addresses of different types.
@@ -232,22 +223,21 @@ class TestGetAllCompanyAddresses:
         Assert: Response contains addresses of different types.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        registered = await CompanyAddressFactory.create(
-            db_session, company, address_type=AddressType.REGISTERED
-        )
-        billing = await CompanyAddressFactory.create_billing(
-            db_session, company
-        )
-        office = await CompanyAddressFactory.create_office(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        company = CompanyFactory.build()
+        db_session.add_all(
+            [company]
+            + [
+                CompanyAddressFactory.build(company, address_type=address_type)
+                for address_type in (
+                    AddressType.REGISTERED,
+                    AddressType.BILLING,
+                    AddressType.OFFICE,
+                )
+            ]
+        )
+        await db_session.flush()
+
+        headers = admin_headers
 
         # Act
         response = await test_client.get(
@@ -267,160 +257,114 @@ class TestCreateCompanyAddress:
     """Tests for POST /v1/company-address endpoint."""
 
     @pytest.mark.asyncio
-    async def test_create_company_address_success(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+    @pytest.mark.parametrize(
+        "address",
+        [
+            pytest.param(
+                {
+                    "type": "REGISTERED",
+                    "street": "100 New Address Lane",
+                    "city": "Boston",
+                    "state": "MA",
+                    "postalCode": "02101",
+                    "country": "US",
+                },
+                id="registered",
+            ),
+            pytest.param(
+                {
+                    "type": "BILLING",
+                    "street": "200 Billing Road",
+                    "city": "Chicago",
+                    "state": "IL",
+                    "postalCode": "60601",
+                    "country": "US",
+                },
+                id="billing",
+            ),
+            pytest.param(
+                {
+                    "type": "OFFICE",
+                    "street": "300 Office Plaza",
+                    "city": "Seattle",
+                    "state": "WA",
+                    "postalCode": "98101",
+                    "country": "US",
+                },
+                id="office",
+            ),
+            pytest.param(
+                {
+                    "type": "SHIPPING",
+                    "street": "400 Warehouse Way",
+                    "city": "Los Angeles",
+                    "state": "CA",
+                    "postalCode": "90001",
+                    "country": "US",
+                },
+                id="shipping",
+            ),
+            pytest.param(
+                {
+                    "type": "OTHER",
+                    "street": "500 Other Street",
+                    "city": "Miami",
+                    "state": "FL",
+                    "postalCode": "33101",
+                    "country": "US",
+                },
+                id="other",
+            ),
+        ],
+    )
+    async def test_create_company_address_by_type(
+        self,
+        test_client: AsyncClient,
+        savepoint,
+        admin_seed,
+        admin_headers,
+        address,
     ):
         """
-        Test create company address with valid data returns created address.
+        Test create company address with each address type.
 
-        Arrange: Create company and admin user.
-        Act: POST /v1/company-address with valid address data.
-        Assert: Response is 200 with created address data.
+        Arrange: Use the seeded admin and its company.
+        Act: POST /v1/company-address with the case's address data.
+        Assert: Response is 200 with the created address data.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        company = admin_seed["company"]
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
             "/v1/company-address/",
             headers=headers,
-            json={
-                "type": "REGISTERED",
-                "street": "100 New Address Lane",
-                "city": "Boston",
-                "state": "MA",
-                "postalCode": "02101",
-                "country": "US",
-                "companyId": str(company.id),
-            },
+            json={**address, "companyId": company.id_str},
         )
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["street"] == "100 New Address Lane"
-        assert data["city"] == "Boston"
-        assert data["state"] == "MA"
-        assert data["postalCode"] == "02101"
-        assert data["country"] == "US"
-        assert data["type"] == "REGISTERED"
+        for field, value in address.items():
+            assert data[field] == value
+        assert data["companyId"] == company.id_str
         assert "id" in data
 
-    @pytest.mark.asyncio
-    async def test_create_company_address_billing_type(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test create company address with BILLING type.
-
-        Arrange: Create company and admin user.
-        Act: POST /v1/company-address with BILLING type.
-        Assert: Response is 200 with BILLING address.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            "/v1/company-address/",
-            headers=headers,
-            json={
-                "type": "BILLING",
-                "street": "200 Billing Road",
-                "city": "Chicago",
-                "state": "IL",
-                "postalCode": "60601",
-                "country": "US",
-                "companyId": str(company.id),
-            },
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["type"] == "BILLING"
-        assert data["street"] == "200 Billing Road"
-
-    @pytest.mark.asyncio
-    async def test_create_company_address_office_type(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test create company address with OFFICE type.
-
-        Arrange: Create company and admin user.
-        Act: POST /v1/company-address with OFFICE type.
-        Assert: Response is 200 with OFFICE address.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            "/v1/company-address/",
-            headers=headers,
-            json={
-                "type": "OFFICE",
-                "street": "300 Office Plaza",
-                "city": "Seattle",
-                "state": "WA",
-                "postalCode": "98101",
-                "country": "US",
-                "companyId": str(company.id),
-            },
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["type"] == "OFFICE"
-        assert data["street"] == "300 Office Plaza"
-
     @pytest.mark.asyncio
     async def test_create_company_address_without_state(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, savepoint, admin_seed, admin_headers
     ):
         """
         Test create company address without state (optional field).
 
-        Arrange: Create company and admin user.
+        Arrange: Use the seeded admin and its company.
         Act: POST /v1/company-address without state field.
         Assert: Response is 200 with null state.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        company = admin_seed["company"]
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -432,7 +376,7 @@ class TestCreateCompanyAddress:
                 "city": "London",
                 "postalCode": "SW1A 1AA",
                 "country": "GB",
-                "companyId": str(company.id),
+                "companyId": company.id_str,
             },
         )
 
@@ -443,116 +387,24 @@ class TestCreateCompanyAddress:
         assert data["city"] == "London"
         assert data["country"] == "GB"
 
-    @pytest.mark.asyncio
-    async def test_create_company_address_shipping_type(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test create company address with SHIPPING type.
-
-        Arrange: Create company and admin user.
-        Act: POST /v1/company-address with SHIPPING type.
-        Assert: Response is 200 with SHIPPING address.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            "/v1/company-address/",
-            headers=headers,
-            json={
-                "type": "SHIPPING",
-                "street": "400 Warehouse Way",
-                "city": "Los Angeles",
-                "state": "CA",
-                "postalCode": "90001",
-                "country": "US",
-                "companyId": str(company.id),
-            },
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["type"] == "SHIPPING"
-
-    @pytest.mark.asyncio
-    async def test_create_company_address_other_type(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
-    ):
-        """
-        Test create company address with OTHER type.
-
-        Arrange: Create company and admin user.
-        Act: POST /v1/company-address with OTHER type.
-        Assert: Response is 200 with OTHER address.
-        """
-        # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act
-        response = await test_client.post(
-            "/v1/company-address/",
-            headers=headers,
-            json={
-                "type": "OTHER",
-                "street": "500 Other Street",
-                "city": "Miami",
-                "state": "FL",
-                "postalCode": "33101",
-                "country": "US",
-                "companyId": str(company.id),
-            },
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["type"] == "OTHER"
-
     @pytest.mark.asyncio
     async def test_create_company_address_for_different_company(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, db_session: AsyncSession, admin_headers
     ):
         """
         Test create company address for a different company.
 
-        Arrange: Create two companies with admin.
-        Act: POST /v1/company-address for company2 while authenticated as company1.
+        Arrange: Create a company other than the seeded admin's.
+        Act: POST /v1/company-address for it as the seeded admin.
         Assert: Response is 200 (depends on permission implementation).
         """
         # Arrange
-        company1 = await CompanyFactory.create(
-            db_session, legal_name="Company One"
-        )
-        company2 = await CompanyFactory.create(
+        other_company = await CompanyFactory.create(
             db_session, legal_name="Company Two"
         )
-        admin = await UserFactory.create_admin(db_session, company1)
-        await db_session.commit()
+        await db_session.flush()
 
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company1.id),
-        )
+        headers = admin_headers
 
         # Act
         response = await test_client.post(
@@ -565,7 +417,7 @@ class TestCreateCompanyAddress:
                 "state": "CO",
                 "postalCode": "80201",
                 "country": "US",
-                "companyId": str(company2.id),
+                "companyId": other_company.id_str,
             },
         )
 
@@ -575,26 +427,30 @@ class TestCreateCompanyAddress:
 
     @pytest.mark.asyncio
     async def test_create_company_address_without_permission_returns_403(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        admin_seed,
     ):
         """
         Test create company address without CREATE.COMPANY_ADDRESS permission returns 403.
 
-        Arrange: Create company and buyer user.
+        Arrange: Create a buyer user in the seeded company.
         Act: POST /v1/company-address with buyer auth.
         Assert: Response is 403 Forbidden.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
+        company = admin_seed["company"]
         buyer = await UserFactory.create(
             db_session, company, role=UserRole.BUYER
         )
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(buyer.id),
+            user_id=buyer.id_str,
             role=UserRole.BUYER,
-            company_id=str(company.id),
+            company_id=company.id_str,
         )
 
         # Act
@@ -608,7 +464,7 @@ class TestCreateCompanyAddress:
                 "state": "AZ",
                 "postalCode": "85001",
                 "country": "US",
-                "companyId": str(company.id),
+                "companyId": company.id_str,
             },
         )
 
@@ -617,25 +473,18 @@ class TestCreateCompanyAddress:
 
     @pytest.mark.asyncio
     async def test_create_company_address_missing_required_fields_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_seed, admin_headers
     ):
         """
         Test create company address without required fields returns 422.
 
-        Arrange: Create company and admin.
+        Arrange: Use the seeded admin and its company.
         Act: POST /v1/company-address with missing street.
         Assert: Response is 422 Unprocessable Entity.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        company = admin_seed["company"]
+        headers = admin_headers
 
         # Act - missing street
         response = await test_client.post(
@@ -646,7 +495,7 @@ class TestCreateCompanyAddress:
                 "city": "Dallas",
                 "postalCode": "75201",
                 "country": "US",
-                "companyId": str(company.id),
+                "companyId": company.id_str,
             },
         )
 
@@ -655,25 +504,18 @@ class TestCreateCompanyAddress:
 
     @pytest.mark.asyncio
     async def test_create_company_address_missing_type_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_seed, admin_headers
     ):
         """
         Test create company address without type returns 422.
 
-        Arrange: Create company and admin.
+        Arrange: Use the seeded admin and its company.
         Act: POST /v1/company-address without type field.
         Assert: Response is 422 Unprocessable Entity.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        company = admin_seed["company"]
+        headers = admin_headers
 
         # Act - missing type
         response = await test_client.post(
@@ -684,7 +526,7 @@ class TestCreateCompanyAddress:
                 "city": "Houston",
                 "postalCode": "77001",
                 "country": "US",
-                "companyId": str(company.id),
+                "companyId": company.id_str,
             },
         )
 
@@ -693,25 +535,17 @@ class TestCreateCompanyAddress:
 
     @pytest.mark.asyncio
     async def test_create_company_address_missing_company_id_returns_error(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers
     ):
         """
         Test create company address without company_id returns error.
 
-        Arrange: Create company and admin.
+        Arrange: Use the seeded admin's headers.
         Act: POST /v1/company-address without companyId.
         Assert: Response is 404 (MonetaID generates random UUID that doesn't exist).
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act - missing companyId (MonetaID will generate a random UUID)
         response = await test_client.post(
@@ -731,25 +565,18 @@ class TestCreateCompanyAddress:
 
     @pytest.mark.asyncio
     async def test_create_company_address_invalid_type_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_seed, admin_headers
     ):
         """
         Test create company address with invalid type returns 422.
 
-        Arrange: Create company and admin.
+        Arrange: Use the seeded admin and its company.
         Act: POST /v1/company-address with invalid type.
         Assert: Response is 422 Unprocessable Entity.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        company = admin_seed["company"]
+        headers = admin_headers
 
         # Act - invalid type
         response = await test_client.post(
@@ -761,7 +588,7 @@ class TestCreateCompanyAddress:
                 "city": "Philadelphia",
                 "postalCode": "19101",
                 "country": "US",
-                "companyId": str(company.id),
+                "companyId": company.id_str,
             },
         )
 
@@ -770,25 +597,17 @@ class TestCreateCompanyAddress:
 
     @pytest.mark.asyncio
     async def test_create_company_address_empty_body_returns_422(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers
     ):
         """
         Test create company address with empty body returns 422.
 
-        Arrange: Create company and admin.
+        Arrange: Use the seeded admin's headers.
         Act: POST /v1/company-address with empty JSON body.
         Assert: Response is 422 Unprocessable Entity.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
 
         # Act - empty body
         response = await test_client.post(
@@ -802,25 +621,17 @@ class TestCreateCompanyAddress:
 
     @pytest.mark.asyncio
     async def test_create_company_address_nonexistent_company_returns_error(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, admin_headers
     ):
         """
         Test create company address for non-existent company returns error.
 
-        Arrange: Create company and admin.
+        Arrange: Use the seeded admin's headers.
         Act: POST /v1/company-address with non-existent companyId.
         Assert: Response is error (400, 404, or 500 depending on implementation).
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
+        headers = admin_headers
         fake_company_id = "00000000-0000-0000-0000-000000000000"
 
         # Act
@@ -844,54 +655,47 @@ class TestCreateCompanyAddress:
 
     @pytest.mark.asyncio
     async def test_create_multiple_addresses_for_same_company(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self, test_client: AsyncClient, savepoint, admin_seed, admin_headers
     ):
         """
         Test creating multiple addresses for the same company.
 
-        Arrange: Create company and admin.
-        Act: POST /v1/company-address twice for same company.
+        Arrange: Use the seeded admin and its company.
+        Act: POST /v1/company-address twice, concurrently, for the same company.
         Assert: Both addresses are created successfully.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
-        admin = await UserFactory.create_admin(db_session, company)
-        await db_session.commit()
-
-        headers = auth_headers(
-            user_id=str(admin.id),
-            role=UserRole.ADMIN,
-            company_id=str(company.id),
-        )
-
-        # Act - create first address
-        response1 = await test_client.post(
-            "/v1/company-address/",
-            headers=headers,
-            json={
-                "type": "REGISTERED",
-                "street": "First Address Street",
-                "city": "Detroit",
-                "state": "MI",
-                "postalCode": "48201",
-                "country": "US",
-                "companyId": str(company.id),
-            },
-        )
-
-        # Act - create second address
-        response2 = await test_client.post(
-            "/v1/company-address/",
-            headers=headers,
-            json={
-                "type": "BILLING",
-                "street": "Second Address Street",
-                "city": "Detroit",
-                "state": "MI",
-                "postalCode": "48202",
-                "country": "US",
-                "companyId": str(company.id),
-            },
+        company = admin_seed["company"]
+        headers = admin_headers
+
+        # Act - create both addresses concurrently
+        response1, response2 = await asyncio.gather(
+            test_client.post(
+                "/v1/company-address/",
+                headers=headers,
+                json={
+                    "type": "REGISTERED",
+                    "street": "First Address Street",
+                    "city": "Detroit",
+                    "state": "MI",
+                    "postalCode": "48201",
+                    "country": "US",
+                    "companyId": company.id_str,
+                },
+            ),
+            test_client.post(
+                "/v1/company-address/",
+                headers=headers,
+                json={
+                    "type": "BILLING",
+                    "street": "Second Address Street",
+                    "city": "Detroit",
+                    "state": "MI",
+                    "postalCode": "48202",
+                    "country": "US",
+                    "companyId": company.id_str,
+                },
+            ),
         )
 
         # Assert
@@ -905,24 +709,28 @@ class TestCreateCompanyAddress:
 
     @pytest.mark.asyncio
     async def test_create_company_address_issuer_permission(
-        self, test_client: AsyncClient, db_session: AsyncSession, auth_headers
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers,
+        admin_seed,
     ):
         """
         Test create company address with issuer role.
 
-        Arrange: Create company and issuer user.
+        Arrange: Create an issuer user in the seeded company.
         Act: POST /v1/company-address with issuer auth.
         Assert: Response depends on issuer permissions for company addresses.
         """
         # Arrange
-        company = await CompanyFactory.create(db_session)
+        company = admin_seed["company"]
         issuer = await UserFactory.create_issuer(db_session, company)
-        await db_session.commit()
+        await db_session.flush()
 
         headers = auth_headers(
-            user_id=str(issuer.id),
+            user_id=issuer.id_str,
             role=UserRole.ISSUER,
-            company_id=str(company.id),
+            company_id=company.id_str,
         )
 
         # Act
@@ -936,7 +744,7 @@ class TestCreateCompanyAddress:
                 "state": "MN",
                 "postalCode": "55401",
                 "country": "US",
-                "companyId": str(company.id),
+                "companyId": company.id_str,
             },
         )
 
@@ -45,7 +45,7 @@ run_tests() {
     echo -e "${GREEN}Starting test containers...${NC}"
 
     docker compose -f docker-compose.test.yml run --rm monolith-test \
-        pytest $test_args -v --durations=10
+        pytest $test_args -n auto --dist loadscope -v --durations=10
 
     local exit_code=$?
 